@@ -1,21 +1,61 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from sqlmodel import Session
 from app.db import create_db_and_tables  # get_session re-exported for tests
-from app.routers import creatures, classes
+from app.db import ASYNC_DB, async_engine, engine, pool_status
+from app.metrics import CONTENT_TYPE, MetricsMiddleware, instrument_engine, metrics
+from app.profiler import SQL_PROFILE, ProfilerMiddleware, profile_engine
+from app.routers import async_classes, async_creatures, creatures, classes, snapshot
+from app.services import classes as classes_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     create_db_and_tables()
+    with Session(engine) as session:
+        if classes_service.SEED_CLASSES:
+            classes_service.seed_default_classes(session)
+        classes_service.registry.load(session)
     yield
+    await async_engine.dispose()
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
+if SQL_PROFILE:
+    app.add_middleware(ProfilerMiddleware)
+    profile_engine(engine)
+    profile_engine(async_engine.sync_engine)
+
+if ASYNC_DB:
+    # Registered first so they take precedence over the sync routes with the
+    # same method and path; the rest (bulk import, export) stay sync.
+    app.include_router(async_creatures.router)
+    app.include_router(async_classes.router)
 
 app.include_router(creatures.router)
 app.include_router(classes.router)
+app.include_router(snapshot.router)
 
 
 @app.get("/")
 def root():
     return {"status": "ok", "service": "creatures-backend"}
+
+
+@app.get("/health")
+def health():
+    # Pool counters help size DB_POOL_SIZE / DB_MAX_OVERFLOW under real load
+    database = {"sync": pool_status(engine)}
+    if ASYNC_DB:
+        database["async"] = pool_status(async_engine.sync_engine)
+    return {"status": "ok", "database": database}
+
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    # Prometheus text exposition format
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
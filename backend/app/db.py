@@ -1,7 +1,12 @@
 import os
 from typing import Annotated
 from fastapi import Depends
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import QueuePool
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import create_search_index
 
 # --- Database Setup ---
 # On Render: set DATABASE_URL to the Postgres "Internal Database URL"
@@ -13,11 +18,122 @@ if DATABASE_URL.startswith("sqlite"):
     # Needed only for SQLite
     connect_args = {"check_same_thread": False}
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+# --- Connection Pool ---
+# Sized per process: with N workers the database sees up to
+# N * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections.
+POOL_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    # Recycle before Postgres / proxies drop idle connections
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    "pool_pre_ping": _env_flag("DB_POOL_PRE_PING", True),
+}
+
+# --- SQLite Tuning ---
+# WAL lets readers continue while a writer commits; busy_timeout makes
+# writers wait for the lock instead of failing with "database is locked".
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000")),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+}
+
+
+def pool_options(url: str) -> dict:
+    # In-memory SQLite uses a single-connection pool without sizing options
+    if url.startswith("sqlite") and (":memory:" in url or url.endswith("://")):
+        return {}
+    return POOL_OPTIONS
+
+
+def enable_sqlite_pragmas(engine: Engine) -> None:
+    """Apply SQLITE_PRAGMAS to every new connection of a SQLite engine."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def pool_status(engine: Engine) -> dict:
+    pool = engine.pool
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=pool.overflow(),
+        )
+    return status
+
+
+engine = create_engine(
+    DATABASE_URL, connect_args=connect_args, **pool_options(DATABASE_URL)
+)
+enable_sqlite_pragmas(engine)
+
+# --- Optional async mode ---
+# DB_ASYNC=1 serves the CRUD endpoints with async sessions so requests wait on
+# the database without holding a threadpool thread. The sync engine above is
+# still used for startup, scripts and the endpoints without an async version.
+ASYNC_DB = _env_flag("DB_ASYNC", False)
+
+# Async drivers for each backend: aiosqlite locally, psycopg 3 on Postgres
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgres": "postgresql+psycopg",
+    "postgresql": "postgresql+psycopg",
+    "postgresql+psycopg": "postgresql+psycopg",
+    "postgresql+psycopg2": "postgresql+psycopg",
+}
+
+
+def to_async_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+# Created eagerly but connects lazily, so it costs nothing in sync mode
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, connect_args=connect_args, **pool_options(ASYNC_DATABASE_URL)
+)
+enable_sqlite_pragmas(async_engine.sync_engine)
+
+
+# Indexes older databases still carry that the models no longer define
+OBSOLETE_INDEXES = [
+    "ix_creature_creature_type",  # covered by ix_creature_creature_type_danger_level
+]
 
 
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
+    # create_all skips tables that already exist, so indexes added to the
+    # models later are created here for databases made by older versions
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    with engine.begin() as connection:
+        for name in OBSOLETE_INDEXES:
+            connection.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+        create_search_index(connection)
 
 
 def get_session():
@@ -26,3 +142,12 @@ def get_session():
 
 
 SessionDep = Annotated[Session, Depends(get_session)]
+
+
+async def get_async_session():
+    # Keep attributes loaded after commit; lazy loads cannot run in async code
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
@@ -0,0 +1,207 @@
+"""Request and SQL metrics, exposed in Prometheus text format on /metrics.
+
+Everything is kept in process memory; with several workers each one
+reports its own numbers, like the pool counters on /health.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from sqlalchemy import Engine, event
+
+# Request latency buckets in seconds (upper bounds; +Inf is implied)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Requests that matched no route share one label to bound cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _RequestStats:
+    __slots__ = ("statements", "sql_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.sql_seconds = 0.0
+
+
+# The stats object is shared, not copied, into the threadpool and the
+# greenlets that run a request's SQL, so engine events can add to it
+_current: ContextVar[_RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+class _RouteMetrics:
+    __slots__ = ("buckets", "seconds", "count", "bytes", "statements", "sql_seconds")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.seconds = 0.0
+        self.count = 0
+        self.bytes = 0
+        self.statements = 0
+        self.sql_seconds = 0.0
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: dict[tuple[str, str, str], int] = {}
+        self._routes: dict[tuple[str, str], _RouteMetrics] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        size: int,
+        stats: _RequestStats,
+    ) -> None:
+        with self._lock:
+            key = (method, route, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+            metrics = self._routes.get((method, route))
+            if metrics is None:
+                metrics = self._routes[(method, route)] = _RouteMetrics()
+            metrics.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            metrics.seconds += seconds
+            metrics.count += 1
+            metrics.bytes += size
+            metrics.statements += stats.statements
+            metrics.sql_seconds += stats.sql_seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._routes.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            requests = sorted(self._requests.items())
+            routes = sorted(
+                (
+                    key,
+                    list(m.buckets),
+                    m.seconds,
+                    m.count,
+                    m.bytes,
+                    m.statements,
+                    m.sql_seconds,
+                )
+                for key, m in self._routes.items()
+            )
+
+        lines = [
+            "# HELP http_requests_total Requests by method, route template and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status), count in requests:
+            labels = _labels(method=method, route=route, status=status)
+            lines.append(f"http_requests_total{{{labels}}} {count}")
+
+        lines += [
+            "# HELP http_request_duration_seconds Request latency by route template.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), buckets, seconds, count, *_ in routes:
+            labels = _labels(method=method, route=route)
+            cumulative = 0
+            for bound, hits in zip((*LATENCY_BUCKETS, "+Inf"), buckets):
+                cumulative += hits
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}}'
+                    f" {cumulative}"
+                )
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {seconds}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {count}")
+
+        counters = (
+            ("http_response_bytes_total", "Response body bytes sent.", 4),
+            ("db_statements_total", "SQL statements executed by requests.", 5),
+            ("db_statement_seconds_total", "Time spent in SQL by requests.", 6),
+        )
+        for name, help_text, field in counters:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for row in routes:
+                (method, route) = row[0]
+                labels = _labels(method=method, route=route)
+                lines.append(f"{name}{{{labels}}} {row[field]}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return ",".join(f'{k}="{escape(v)}"' for k, v in labels.items())
+
+
+metrics = Metrics()
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware: no request/response objects, no body buffering."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = _RequestStats()
+        token = _current.set(stats)
+        status = 500  # reported if the app fails before sending a response
+        size = 0
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current.reset(token)
+            route = scope.get("route")
+            template = getattr(route, "path", None) or UNMATCHED_ROUTE
+            metrics.observe(scope["method"], template, status, elapsed, size, stats)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metrics_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("metrics_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.sql_seconds += elapsed
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    conn = exception_context.connection
+    starts = conn.info.get("metrics_start") if conn is not None else None
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count statements and SQL time per request on this (sync) engine."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -1,18 +1,27 @@
 from typing import Optional
+from sqlalchemy import Index, event
 from sqlmodel import SQLModel, Field
 
 
 class CreatureBase(SQLModel):
     name: str = Field(index=True)
-    mythology: str
+    mythology: str = Field(index=True)
+    # Indexed through ix_creature_creature_type_danger_level, which leads with it
     creature_type: str
-    danger_level: int
-    habitat: str = Field(default="Unknown")
+    danger_level: int = Field(index=True)
+    habitat: str = Field(default="Unknown", index=True)
     last_modify: str = Field(default="Unknown")
     image_url: str = Field(default="")
 
 
 class Creature(CreatureBase, table=True):
+    # Class + danger range is the most common dashboard filter combination
+    __table_args__ = (
+        Index(
+            "ix_creature_creature_type_danger_level", "creature_type", "danger_level"
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
 
@@ -24,6 +33,31 @@ class CreatureRead(CreatureBase):
     id: int
 
 
+class CreatureBulkResult(SQLModel):
+    created: int
+    classes_created: list[str] = Field(default_factory=list)
+
+
+class CreatureStats(SQLModel):
+    total: int
+    critical: int  # danger_level >= 9
+    added_last_24h: int
+    added_this_month: int
+    danger_levels: dict[int, int]  # danger_level -> count
+    creature_types: dict[str, int]  # the keys double as the filter facets
+    mythologies: dict[str, int]
+    habitats: dict[str, int]
+
+
+class CreatureFilter(SQLModel):
+    name: Optional[str] = None  # case-insensitive substring
+    creature_type: list[str] = Field(default_factory=list)
+    mythology: list[str] = Field(default_factory=list)
+    habitat: list[str] = Field(default_factory=list)
+    min_danger: Optional[int] = None
+    max_danger: Optional[int] = None
+
+
 class CreatureClassBase(SQLModel):
     name: str = Field(index=True, unique=True)
     color: str = Field(
@@ -45,8 +79,107 @@ class CreatureClassRead(CreatureClassBase):
     id: int
 
 
+class CreatureClassUpdateRead(CreatureClassRead):
+    creatures_updated: int = 0  # rows moved to the new name by a rename
+
+
+class Snapshot(SQLModel):
+    """Classes plus the first creatures page, for a one-request dashboard load."""
+
+    creatures: list[CreatureRead]
+    classes: list[CreatureClassRead]
+    next_cursor: Optional[int] = None  # pass as after_id to GET /creatures/
+    total: int = 0  # every creature, as X-Total-Count on GET /creatures/
+    versions: dict[str, int] = Field(default_factory=dict)  # as GET /version
+
+
 class CreatureClassUpdate(SQLModel):
     name: Optional[str] = None
     color: Optional[str] = None
     border_color: Optional[str] = None
     text_color: Optional[str] = None
+
+
+class TableVersion(SQLModel, table=True):
+    """Change counter per table, bumped in the same transaction as each write."""
+
+    name: str = Field(primary_key=True)
+    version: int = Field(default=0)
+
+
+@event.listens_for(TableVersion.__table__, "after_create")
+def seed_table_versions(target, connection, **kw):
+    connection.execute(
+        target.insert(),
+        [
+            {"name": Creature.__tablename__, "version": 0},
+            {"name": CreatureClass.__tablename__, "version": 0},
+        ],
+    )
+
+
+# --- Search index ---
+# SQLite: an external-content FTS5 table with the trigram tokenizer, kept in
+# sync by triggers, so bulk inserts and bulk updates are covered too.
+# Postgres: a pg_trgm GIN index over the same searchable text.
+SEARCH_TABLE = "creature_search"
+SEARCH_COLUMNS = ("name", "mythology", "habitat")
+
+_columns = ", ".join(SEARCH_COLUMNS)
+_new_values = ", ".join(f"new.{c}" for c in SEARCH_COLUMNS)
+_old_values = ", ".join(f"old.{c}" for c in SEARCH_COLUMNS)
+_index_new = (
+    f"INSERT INTO {SEARCH_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});"
+)
+_index_old = (
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {_columns}) "
+    f"VALUES ('delete', old.id, {_old_values});"
+)
+SQLITE_SEARCH_TRIGGERS = {
+    f"{SEARCH_TABLE}_ai": f"AFTER INSERT ON creature BEGIN {_index_new} END",
+    f"{SEARCH_TABLE}_ad": f"AFTER DELETE ON creature BEGIN {_index_old} END",
+    f"{SEARCH_TABLE}_au": (
+        f"AFTER UPDATE OF {_columns} ON creature BEGIN {_index_old} {_index_new} END"
+    ),
+}
+POSTGRES_SEARCH_DOCUMENT = "(name || ' ' || mythology || ' ' || habitat)"
+
+
+def create_search_index(connection) -> None:
+    """Create the search index if missing, indexing any existing rows."""
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        connection.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_creature_search_trgm ON creature "
+            f"USING gin ({POSTGRES_SEARCH_DOCUMENT} gin_trgm_ops)"
+        )
+        return
+    if connection.dialect.name != "sqlite":
+        return
+
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE name = ?", (SEARCH_TABLE,)
+    ).first()
+    if not exists:
+        connection.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5({_columns}, "
+            "content='creature', content_rowid='id', tokenize='trigram')"
+        )
+        # Databases created before the index: pick up the rows already there
+        connection.exec_driver_sql(
+            f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"
+        )
+    for name, body in SQLITE_SEARCH_TRIGGERS.items():
+        connection.exec_driver_sql(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+@event.listens_for(Creature.__table__, "after_create")
+def create_search_index_for_table(target, connection, **kw):
+    create_search_index(connection)
+
+
+@event.listens_for(Creature.__table__, "before_drop")
+def drop_search_index(target, connection, **kw):
+    # The external-content table would point at rows that no longer exist
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
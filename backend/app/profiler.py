@@ -0,0 +1,122 @@
+"""Opt-in SQL profiler: statement counts, DB time and N+1 hints per request.
+
+Enable with SQL_PROFILE=1. Each request then logs one line on the
+"app.profiler" logger, at WARNING when a statement shape repeats often
+enough to look like an N+1 loop. Tests use profile_statements() directly
+through the sql_budget fixture in tests/conftest.py.
+"""
+
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+
+SQL_PROFILE = os.getenv("SQL_PROFILE", "").lower() in ("1", "true", "yes")
+# Same statement shape this many times in one request reads as N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_PROFILE_REPEATS", "3"))
+SLOWEST_SHOWN = 3
+
+logger = logging.getLogger("app.profiler")
+
+_profile: ContextVar["Profile | None"] = ContextVar("sql_profile", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """SQL with whitespace and expanded IN (?, ?, ...) lists collapsed."""
+    return _PLACEHOLDER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class Profile:
+    def __init__(self):
+        self.statements: list[tuple[str, float]] = []  # (shape, seconds)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def seconds(self) -> float:
+        return sum(seconds for _, seconds in self.statements)
+
+    def slowest(self, n: int = SLOWEST_SHOWN) -> list[tuple[str, float]]:
+        return sorted(self.statements, key=lambda s: s[1], reverse=True)[:n]
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> dict[str, int]:
+        """Statement shapes run at least threshold times."""
+        counts = Counter(shape for shape, _ in self.statements)
+        return {shape: n for shape, n in counts.items() if n >= threshold}
+
+    def report(self) -> str:
+        lines = [f"{self.count} statements, {self.seconds * 1000:.1f} ms in SQL"]
+        lines += [f"  {s * 1000:7.2f} ms  {shape}" for shape, s in self.slowest()]
+        lines += [
+            f"  repeated x{n} (N+1?): {shape}" for shape, n in self.repeated().items()
+        ]
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile_statements():
+    """Collect the statements run (in this context) inside the block."""
+    profile = Profile()
+    token = _profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _profile.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Marked on the execution context, so a statement is recorded once even
+    # when both an engine and the Engine class carry these listeners
+    if _profile.get() is not None and getattr(context, "_profile_start", None) is None:
+        context._profile_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_profile_start", None)
+    profile = _profile.get()
+    if start is None or profile is None:
+        return
+    context._profile_start = None
+    profile.statements.append((statement_shape(statement), time.perf_counter() - start))
+
+
+def profile_engine(target) -> None:
+    """Attach the profiler to an engine (or the Engine class for all)."""
+    if event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+
+class ProfilerMiddleware:
+    """Pure ASGI middleware logging each request's SQL profile."""
+
+    def __init__(self, app):
+        self.app = app
+        # Shown without any logging setup, e.g. under plain uvicorn
+        if not logger.handlers:
+            logger.addHandler(logging.StreamHandler())
+            logger.setLevel(logging.INFO)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_statements() as profile:
+            await self.app(scope, receive, send)
+
+        if not profile.count:
+            return
+        route = getattr(scope.get("route"), "path", scope["path"])
+        level = logging.WARNING if profile.repeated() else logging.INFO
+        logger.log(level, "%s %s: %s", scope["method"], route, profile.report())
@@ -0,0 +1,44 @@
+"""Async class endpoints, mounted ahead of the sync router in DB_ASYNC mode."""
+
+from fastapi import APIRouter, Request, Response
+from app.db import AsyncSessionDep
+from app.models import (
+    CreatureClassCreate,
+    CreatureClassRead,
+    CreatureClassUpdate,
+    CreatureClassUpdateRead,
+)
+from app.services import async_classes as service
+from app.services import async_versions, versions
+
+router = APIRouter(prefix="/classes", tags=["classes"])
+
+
+@router.post("/", response_model=CreatureClassRead)
+async def create_class(class_data: CreatureClassCreate, session: AsyncSessionDep):
+    return await service.create_class(session, class_data)
+
+
+@router.get("/", response_model=list[CreatureClassRead])
+async def read_classes(session: AsyncSessionDep, request: Request, response: Response):
+    version = await async_versions.current(session, versions.CLASSES)
+    versions.check_not_modified(request, response, versions.CLASSES, version)
+    return await service.list_classes(session, version)
+
+
+@router.delete("/{class_id}")
+async def delete_class(class_id: int, session: AsyncSessionDep):
+    await service.delete_class(session, class_id)
+    return {"ok": True}
+
+
+@router.put("/{class_id}", response_model=CreatureClassUpdateRead)
+async def update_class(
+    class_id: int, class_update: CreatureClassUpdate, session: AsyncSessionDep
+):
+    db_class, creatures_updated = await service.update_class(
+        session, class_id, class_update
+    )
+    return CreatureClassUpdateRead.model_validate(
+        db_class, update={"creatures_updated": creatures_updated}
+    )
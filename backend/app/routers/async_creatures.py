@@ -0,0 +1,70 @@
+"""Async CRUD endpoints for creatures, mounted ahead of the sync router in
+DB_ASYNC mode. Bulk import and export keep their sync implementations."""
+
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query, Request, Response
+from app.db import AsyncSessionDep
+from app.models import CreatureCreate, CreatureFilter, CreatureRead
+from app.routers.creatures import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, creature_filters
+from app.services import async_creatures as service
+from app.services import async_versions, versions
+
+router = APIRouter(prefix="/creatures", tags=["creatures"])
+
+
+@router.post("/", response_model=CreatureRead)
+async def create_creature_endpoint(
+    creature: CreatureCreate, session: AsyncSessionDep
+) -> CreatureRead:
+    return await service.create_creature(session, creature)
+
+
+@router.get("/", response_model=list[CreatureRead])
+async def get_creatures_endpoint(
+    session: AsyncSessionDep,
+    response: Response,
+    request: Request,
+    filters: Annotated[CreatureFilter, Depends(creature_filters)],
+    after_id: int | None = Query(None, description="Return creatures after this id"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    with_total: bool = Query(False, description="Send X-Total-Count"),
+) -> list[CreatureRead]:
+    version = await async_versions.current(session, versions.CREATURES)
+    versions.check_not_modified(request, response, versions.CREATURES, version)
+    # Fetch one extra row to know whether another page exists
+    creatures = await service.list_creatures(
+        session, after_id=after_id, limit=limit + 1, filters=filters
+    )
+    if len(creatures) > limit:
+        creatures = creatures[:limit]
+        response.headers["X-Next-Cursor"] = str(creatures[-1].id)
+    if with_total:
+        # Opt-in: a COUNT over the filtered rows is the one cost here that
+        # grows with the table
+        total = await service.count_creatures(session, filters)
+        response.headers["X-Total-Count"] = str(total)
+    return creatures
+
+
+# The :int convertor keeps this route from swallowing /creatures/export and
+# the other literal paths served by the sync router
+@router.get("/{creature_id:int}", response_model=CreatureRead)
+async def get_creature_endpoint(
+    creature_id: int, session: AsyncSessionDep, request: Request, response: Response
+) -> CreatureRead:
+    version = await async_versions.current(session, versions.CREATURES)
+    versions.check_not_modified(request, response, versions.CREATURES, version)
+    return await service.get_creature(session, creature_id)
+
+
+@router.put("/{creature_id:int}", response_model=CreatureRead)
+async def update_creature_endpoint(
+    creature_id: int, creature: CreatureCreate, session: AsyncSessionDep
+) -> CreatureRead:
+    return await service.update_creature(session, creature_id, creature)
+
+
+@router.delete("/{creature_id:int}")
+async def delete_creature_endpoint(creature_id: int, session: AsyncSessionDep) -> dict:
+    await service.delete_creature(session, creature_id)
+    return {"detail": "creature deleted successfully"}
@@ -1,11 +1,13 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 from app.db import SessionDep
 from app.models import (
     CreatureClassCreate,
     CreatureClassRead,
     CreatureClassUpdate,
+    CreatureClassUpdateRead,
 )
 from app.services import classes as service
+from app.services import versions
 
 router = APIRouter(prefix="/classes", tags=["classes"])
 
@@ -16,8 +18,10 @@ def create_class(class_data: CreatureClassCreate, session: SessionDep):
 
 
 @router.get("/", response_model=list[CreatureClassRead])
-def read_classes(session: SessionDep):
-    return service.list_classes(session)
+def read_classes(session: SessionDep, request: Request, response: Response):
+    version = versions.current(session, versions.CLASSES)
+    versions.check_not_modified(request, response, versions.CLASSES, version)
+    return service.list_classes(session, version)
 
 
 @router.delete("/{class_id}")
@@ -26,6 +30,9 @@ def delete_class(class_id: int, session: SessionDep):
     return {"ok": True}
 
 
-@router.put("/{class_id}", response_model=CreatureClassRead)
+@router.put("/{class_id}", response_model=CreatureClassUpdateRead)
 def update_class(class_id: int, class_update: CreatureClassUpdate, session: SessionDep):
-    return service.update_class(session, class_id, class_update)
+    db_class, creatures_updated = service.update_class(session, class_id, class_update)
+    return CreatureClassUpdateRead.model_validate(
+        db_class, update={"creatures_updated": creatures_updated}
+    )
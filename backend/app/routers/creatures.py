@@ -1,10 +1,51 @@
-from fastapi import APIRouter
-from app.models import CreatureCreate, CreatureRead
+import csv
+import io
+from itertools import batched
+from typing import Annotated, Literal
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from app.models import (
+    CreatureBulkResult,
+    CreatureCreate,
+    CreatureFilter,
+    CreatureRead,
+    CreatureStats,
+)
 from app.db import SessionDep
 from app.services import creatures as service
+from app.services import search
+from app.services import versions
 
 router = APIRouter(prefix="/creatures", tags=["creatures"])
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EXPORT_BATCH_SIZE = 500
+_creature_list = TypeAdapter(list[CreatureCreate])
+
+
+def creature_filters(
+    name: str | None = Query(None, description="Case-insensitive name substring"),
+    creature_type: list[str] = Query([]),
+    mythology: list[str] = Query([]),
+    habitat: list[str] = Query([]),
+    min_danger: int | None = Query(None),
+    max_danger: int | None = Query(None),
+) -> CreatureFilter:
+    return CreatureFilter(
+        name=name,
+        creature_type=creature_type,
+        mythology=mythology,
+        habitat=habitat,
+        min_danger=min_danger,
+        max_danger=max_danger,
+    )
+
 
 @router.post("/", response_model=CreatureRead)
 def create_creature_endpoint(
@@ -13,13 +54,171 @@ def create_creature_endpoint(
     return service.create_creature(session, creature)
 
 
+async def _read_ndjson(request: Request) -> list[CreatureCreate]:
+    """Validate an NDJSON body line by line as it streams in."""
+    creatures = []
+    buffer = b""
+    line_no = 0
+
+    def parse(line: bytes):
+        if not line.strip():
+            return
+        try:
+            creatures.append(CreatureCreate.model_validate_json(line))
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**err, "loc": ("body", line_no, *err["loc"])} for err in e.errors()]
+            )
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            parse(line)
+            line_no += 1
+    parse(buffer)
+    return creatures
+
+
+async def _read_json_array(request: Request) -> list[CreatureCreate]:
+    try:
+        return _creature_list.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors()]
+        )
+
+
+@router.post(
+    "/bulk",
+    response_model=CreatureBulkResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                media_type: {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/CreatureCreate"},
+                    }
+                }
+                for media_type in ("application/json", NDJSON_MEDIA_TYPE)
+            },
+        }
+    },
+)
+async def bulk_create_creatures_endpoint(
+    request: Request,
+    session: SessionDep,
+    batch_size: int = Query(1000, ge=1, le=10000),
+) -> CreatureBulkResult:
+    """Import a JSON array or an NDJSON stream (one creature per line)."""
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith(NDJSON_MEDIA_TYPE):
+        creatures = await _read_ndjson(request)
+    else:
+        creatures = await _read_json_array(request)
+    # The database work is blocking, keep it off the event loop
+    return await run_in_threadpool(
+        service.bulk_create_creatures, session, creatures, batch_size
+    )
+
+
 @router.get("/", response_model=list[CreatureRead])
-def get_creatures_endpoint(session: SessionDep) -> list[CreatureRead]:
-    return service.list_creatures(session)
+def get_creatures_endpoint(
+    session: SessionDep,
+    response: Response,
+    request: Request,
+    filters: Annotated[CreatureFilter, Depends(creature_filters)],
+    after_id: int | None = Query(None, description="Return creatures after this id"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    with_total: bool = Query(False, description="Send X-Total-Count"),
+) -> list[CreatureRead]:
+    version = versions.current(session, versions.CREATURES)
+    versions.check_not_modified(request, response, versions.CREATURES, version)
+    # Fetch one extra row to know whether another page exists
+    creatures = service.list_creatures(
+        session, after_id=after_id, limit=limit + 1, filters=filters
+    )
+    if len(creatures) > limit:
+        creatures = creatures[:limit]
+        response.headers["X-Next-Cursor"] = str(creatures[-1].id)
+    if with_total:
+        # Opt-in: a COUNT over the filtered rows is the one cost here that
+        # grows with the table
+        total = service.count_creatures(session, filters)
+        response.headers["X-Total-Count"] = str(total)
+    return creatures
+
+
+def _export_ndjson(creatures):
+    for batch in batched(creatures, EXPORT_BATCH_SIZE):
+        yield "".join(
+            CreatureRead.model_validate(c).model_dump_json() + "\n" for c in batch
+        )
+
+
+def _export_csv(creatures):
+    fields = list(CreatureRead.model_fields)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+    writer.writeheader()
+    for batch in batched(creatures, EXPORT_BATCH_SIZE):
+        writer.writerows(c.model_dump(include=set(fields)) for c in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Only the header is left over when there were no rows
+    if buffer.getvalue():
+        yield buffer.getvalue()
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {NDJSON_MEDIA_TYPE: {}, "text/csv": {}},
+            "description": "Every matching creature, streamed in id order.",
+        }
+    },
+)
+def export_creatures_endpoint(
+    session: SessionDep,
+    filters: Annotated[CreatureFilter, Depends(creature_filters)],
+    format: Literal["ndjson", "csv"] = "ndjson",
+) -> StreamingResponse:
+    creatures = service.iter_creatures(session, filters, EXPORT_BATCH_SIZE)
+    if format == "csv":
+        return StreamingResponse(
+            _export_csv(creatures),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="creatures.csv"'},
+        )
+    return StreamingResponse(_export_ndjson(creatures), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get("/stats", response_model=CreatureStats)
+def get_creature_stats_endpoint(session: SessionDep) -> CreatureStats:
+    return service.creature_stats(session)
+
+
+@router.get("/search", response_model=list[CreatureRead])
+def search_creatures_endpoint(
+    session: SessionDep,
+    filters: Annotated[CreatureFilter, Depends(creature_filters)],
+    q: str = Query(..., min_length=1, description="Name, mythology or habitat"),
+    limit: int = Query(20, ge=1, le=100),
+) -> list[CreatureRead]:
+    return search.search_creatures(session, q, limit, filters)
 
 
 @router.get("/{creature_id}", response_model=CreatureRead)
-def get_creature_endpoint(creature_id: int, session: SessionDep) -> CreatureRead:
+def get_creature_endpoint(
+    creature_id: int, session: SessionDep, request: Request, response: Response
+) -> CreatureRead:
+    version = versions.current(session, versions.CREATURES)
+    versions.check_not_modified(request, response, versions.CREATURES, version)
     return service.get_creature(session, creature_id)
 
 
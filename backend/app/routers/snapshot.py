@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Query, Request, Response
+from app.db import SessionDep
+from app.models import Snapshot
+from app.routers.creatures import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.services import classes as classes_service
+from app.services import creatures as creatures_service
+from app.services import versions
+
+router = APIRouter(tags=["snapshot"])
+
+
+@router.get("/snapshot", response_model=Snapshot)
+def read_snapshot(
+    session: SessionDep,
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    creatures_version = versions.current(session, versions.CREATURES)
+    classes_version = versions.current(session, versions.CLASSES)
+    versions.check_not_modified(
+        request, response, "snapshot", f"{creatures_version}.{classes_version}"
+    )
+
+    creatures = creatures_service.list_creatures(session, limit=limit + 1)
+    next_cursor = None
+    if len(creatures) > limit:
+        creatures = creatures[:limit]
+        next_cursor = creatures[-1].id
+    return Snapshot(
+        creatures=creatures,
+        classes=classes_service.list_classes(session, classes_version),
+        next_cursor=next_cursor,
+        total=creatures_service.count_creatures(session),
+        versions={
+            versions.CREATURES: creatures_version,
+            versions.CLASSES: classes_version,
+        },
+    )
+
+
+@router.get("/version")
+def read_versions(session: SessionDep) -> dict[str, int]:
+    # Change token per table; clients refetch a collection only when its
+    # number moved since they cached it
+    return versions.all_versions(session)
@@ -0,0 +1,122 @@
+"""Async counterparts of app.services.classes for DB_ASYNC mode."""
+
+from fastapi import HTTPException
+from sqlmodel import select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import (
+    Creature,
+    CreatureClass,
+    CreatureClassCreate,
+    CreatureClassRead,
+    CreatureClassUpdate,
+)
+from app.services import async_versions, versions
+from app.services.classes import registry
+
+
+async def load_registry(
+    session: AsyncSession, version: int | None = None
+) -> list[CreatureClassRead]:
+    if version is None:
+        version = await async_versions.current(session, versions.CLASSES)
+    result = await session.exec(select(CreatureClass))
+    return registry.replace(result.all(), version)
+
+
+async def class_exists(session: AsyncSession, name: str) -> bool:
+    version = await async_versions.current(session, versions.CLASSES)
+    if not registry.loaded:
+        await load_registry(session, version)
+    if registry.contains(name, version):
+        return True
+    result = await session.exec(select(CreatureClass).where(CreatureClass.name == name))
+    db_class = result.first()
+    if db_class:
+        registry.put(db_class)
+    return db_class is not None
+
+
+async def create_class(
+    session: AsyncSession, class_data: CreatureClassCreate
+) -> CreatureClass:
+    # Check uniqueness
+    result = await session.exec(
+        select(CreatureClass).where(CreatureClass.name == class_data.name)
+    )
+    if result.first():
+        raise HTTPException(status_code=400, detail="Class already exists")
+
+    db_class = CreatureClass.model_validate(class_data)
+    session.add(db_class)
+    version = await async_versions.bump(session, versions.CLASSES)
+    await session.commit()
+    await session.refresh(db_class)
+    registry.put(db_class)
+    registry.advance(version)
+    return db_class
+
+
+async def list_classes(
+    session: AsyncSession, version: int | None = None
+) -> list[CreatureClassRead]:
+    if version is None:
+        version = await async_versions.current(session, versions.CLASSES)
+    classes = registry.snapshot(version)
+    if classes is None:
+        classes = await load_registry(session, version)
+    return classes
+
+
+async def get_class(session: AsyncSession, class_id: int) -> CreatureClass:
+    class_item = await session.get(CreatureClass, class_id)
+    if not class_item:
+        raise HTTPException(status_code=404, detail="Class not found")
+    return class_item
+
+
+async def delete_class(session: AsyncSession, class_id: int):
+    class_item = await get_class(session, class_id)
+    name = class_item.name
+    await session.delete(class_item)
+    version = await async_versions.bump(session, versions.CLASSES)
+    await session.commit()
+    registry.discard(name)
+    registry.advance(version)
+
+
+async def update_class(
+    session: AsyncSession, class_id: int, class_update: CreatureClassUpdate
+) -> tuple[CreatureClass, int]:
+    """Update a class; returns it with the number of creatures renamed."""
+    db_class = await get_class(session, class_id)
+
+    old_name = db_class.name
+    update_data = class_update.model_dump(exclude_unset=True)
+    new_name = update_data.get("name")
+    name_changed = new_name and new_name != old_name
+
+    for key, value in update_data.items():
+        setattr(db_class, key, value)
+    session.add(db_class)
+
+    creatures_updated = 0
+    tables = [versions.CLASSES]
+    if name_changed:
+        result = await session.exec(
+            update(Creature)
+            .where(Creature.creature_type == old_name)
+            .values(creature_type=new_name)
+        )
+        creatures_updated = result.rowcount
+        if creatures_updated:
+            tables.append(versions.CREATURES)
+
+    bumped = await async_versions.bump_all(session, tables)
+    version = bumped[versions.CLASSES]
+    await session.commit()
+    await session.refresh(db_class)
+    if name_changed:
+        registry.discard(old_name)
+    registry.put(db_class)
+    registry.advance(version)
+    return db_class, creatures_updated
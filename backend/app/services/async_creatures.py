@@ -0,0 +1,85 @@
+"""Async counterparts of app.services.creatures for DB_ASYNC mode."""
+
+from datetime import datetime, timezone
+from fastapi import HTTPException
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import Creature, CreatureClass, CreatureCreate, CreatureFilter
+from app.services import async_classes, async_versions, versions
+from app.services.creatures import (
+    DEFAULT_CLASS_STYLE,
+    apply_defaults,
+    count_statement,
+    page_statement,
+)
+
+
+async def create_creature(session: AsyncSession, creature: CreatureCreate) -> Creature:
+    apply_defaults(creature)
+
+    # --- AUTO-REGISTER CLASS ---
+    new_class = None
+    tables = [versions.CREATURES]
+    if not await async_classes.class_exists(session, creature.creature_type):
+        new_class = CreatureClass(name=creature.creature_type, **DEFAULT_CLASS_STYLE)
+        session.add(new_class)
+        tables.append(versions.CLASSES)
+
+    db_creature = Creature.model_validate(creature)
+    session.add(db_creature)
+    bumped = await async_versions.bump_all(session, tables)
+    await session.commit()
+    await session.refresh(db_creature)
+    if new_class is not None:
+        async_classes.registry.put(new_class)
+        async_classes.registry.advance(bumped[versions.CLASSES])
+    return db_creature
+
+
+async def list_creatures(
+    session: AsyncSession,
+    after_id: int | None = None,
+    limit: int | None = None,
+    filters: CreatureFilter | None = None,
+) -> list[Creature]:
+    result = await session.exec(page_statement(after_id, limit, filters))
+    return result.all()
+
+
+async def count_creatures(
+    session: AsyncSession, filters: CreatureFilter | None = None
+) -> int:
+    result = await session.exec(count_statement(filters))
+    return result.one()
+
+
+async def get_creature(session: AsyncSession, creature_id: int) -> Creature:
+    creature = await session.get(Creature, creature_id)
+    if not creature:
+        raise HTTPException(status_code=404, detail="Creature not found")
+    return creature
+
+
+async def update_creature(
+    session: AsyncSession, creature_id: int, creature: CreatureCreate
+) -> Creature:
+    db_creature = await get_creature(session, creature_id)
+
+    creature_data = creature.model_dump(exclude_unset=True)
+    for key, value in creature_data.items():
+        setattr(db_creature, key, value)
+
+    # Update timestamp
+    db_creature.last_modify = datetime.now(timezone.utc).isoformat()
+
+    session.add(db_creature)
+    await async_versions.bump(session, versions.CREATURES)
+    await session.commit()
+    await session.refresh(db_creature)
+    return db_creature
+
+
+async def delete_creature(session: AsyncSession, creature_id: int) -> None:
+    db_creature = await get_creature(session, creature_id)
+    await session.delete(db_creature)
+    await async_versions.bump(session, versions.CREATURES)
+    await session.commit()
@@ -0,0 +1,24 @@
+"""Async counterparts of app.services.versions for DB_ASYNC mode."""
+
+from collections.abc import Iterable
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.services.versions import bump_statement, current_statement
+
+
+async def current(session: AsyncSession, table: str) -> int:
+    result = await session.exec(current_statement(table))
+    return result.first() or 0
+
+
+async def bump(session: AsyncSession, table: str) -> int:
+    """Increment the table's version inside the caller's transaction."""
+    return (await bump_all(session, [table]))[table]
+
+
+async def bump_all(session: AsyncSession, tables: Iterable[str]) -> dict[str, int]:
+    """Increment several versions, locking their rows in table name order."""
+    bumped = {}
+    for table in sorted(set(tables)):
+        result = await session.exec(bump_statement(table))
+        bumped[table] = result.scalar_one()
+    return bumped
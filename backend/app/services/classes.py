@@ -1,11 +1,210 @@
-from sqlmodel import Session, select
+import os
+import threading
+from collections.abc import Iterable
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select, update
 from fastapi import HTTPException
 from app.models import (
     CreatureClass,
     CreatureClassCreate,
+    CreatureClassRead,
     CreatureClassUpdate,
     Creature,
 )
+from app.services import versions
+
+# Both support INSERT ... ON CONFLICT DO NOTHING RETURNING
+DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# SEED_CLASSES=1 inserts DEFAULT_CLASSES (those missing) at startup
+SEED_CLASSES = os.getenv("SEED_CLASSES", "").lower() in ("1", "true", "yes")
+
+DEFAULT_CLASSES = [
+    {
+        "name": "Draconic",
+        "color": "rgba(255, 107, 107, 0.2)",
+        "border_color": "rgba(255, 107, 107, 0.8)",
+        "text_color": "#ff6b6b",
+    },
+    {
+        "name": "Chimeric",
+        "color": "rgba(255, 159, 67, 0.2)",
+        "border_color": "rgba(255, 159, 67, 0.8)",
+        "text_color": "#ff9f43",
+    },
+    {
+        "name": "Fae",
+        "color": "rgba(254, 202, 87, 0.2)",
+        "border_color": "rgba(254, 202, 87, 0.8)",
+        "text_color": "#feca57",
+    },
+    {
+        "name": "Titanic",
+        "color": "rgba(72, 219, 251, 0.2)",
+        "border_color": "rgba(72, 219, 251, 0.8)",
+        "text_color": "#48dbfb",
+    },
+    {
+        "name": "Abyssal",
+        "color": "rgba(84, 160, 255, 0.2)",
+        "border_color": "rgba(84, 160, 255, 0.8)",
+        "text_color": "#54a0ff",
+    },
+    {
+        "name": "Ethereal",
+        "color": "rgba(200, 214, 229, 0.2)",
+        "border_color": "rgba(200, 214, 229, 0.8)",
+        "text_color": "#c8d6e5",
+    },
+    {
+        "name": "Mythic Beasts",
+        "color": "rgba(95, 39, 205, 0.2)",
+        "border_color": "rgba(95, 39, 205, 0.8)",
+        "text_color": "#5f27cd",
+    },
+    {
+        "name": "Other",
+        "color": "rgba(131, 149, 167, 0.2)",
+        "border_color": "rgba(131, 149, 167, 0.8)",
+        "text_color": "#8395a7",
+    },
+]
+
+
+class ClassRegistry:
+    """In-process cache of every creature class, keyed by name.
+
+    Loaded at startup and kept current by the write paths in this process
+    after they commit. It remembers the classes table version it matches,
+    so listings reload it when another process has written since; the
+    existence check falls back to the database in that case too, and when
+    a name is missing.
+
+    Sync routes share it across threadpool workers, so every read and
+    write of the map goes through the lock; queries run outside it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._classes: dict[str, CreatureClassRead] | None = None
+        self.version: int | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._classes is not None
+
+    def replace(
+        self, classes: Iterable[CreatureClass], version: int
+    ) -> list[CreatureClassRead]:
+        loaded = {c.name: CreatureClassRead.model_validate(c) for c in classes}
+        with self._lock:
+            self._classes = loaded
+            self.version = version
+        return _sorted(loaded)
+
+    def load(
+        self, session: Session, version: int | None = None
+    ) -> list[CreatureClassRead]:
+        if version is None:
+            version = versions.current(session, versions.CLASSES)
+        return self.replace(session.exec(select(CreatureClass)).all(), version)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._classes = None
+            self.version = None
+
+    def advance(self, version: int) -> None:
+        """Record a local write that moved the classes table to `version`."""
+        with self._lock:
+            if self.version == version - 1:
+                self.version = version
+            else:
+                # Someone else wrote in between; our copy may be missing it
+                self._classes = None
+                self.version = None
+
+    def put(self, db_class: CreatureClass | CreatureClassRead) -> None:
+        class_read = CreatureClassRead.model_validate(db_class)
+        with self._lock:
+            if self._classes is not None:
+                self._classes[class_read.name] = class_read
+
+    def discard(self, name: str) -> None:
+        with self._lock:
+            if self._classes is not None:
+                self._classes.pop(name, None)
+
+    def snapshot(self, version: int) -> list[CreatureClassRead] | None:
+        """Every class sorted by id if loaded at `version`, else None."""
+        with self._lock:
+            if self._classes is None or self.version != version:
+                return None
+            classes = dict(self._classes)
+        return _sorted(classes)
+
+    def contains(self, name: str, version: int) -> bool:
+        """True if name is a class as of `version`; False when unsure."""
+        with self._lock:
+            return (
+                self._classes is not None
+                and self.version == version
+                and name in self._classes
+            )
+
+
+def _sorted(classes: dict[str, CreatureClassRead]) -> list[CreatureClassRead]:
+    return sorted(classes.values(), key=lambda c: c.id)
+
+
+registry = ClassRegistry()
+
+
+def class_exists(session: Session, name: str) -> bool:
+    """Registry lookup against the current classes version; a miss or a
+    version another process moved costs a query, as the class may have been
+    registered or deleted since this one loaded."""
+    version = versions.current(session, versions.CLASSES)
+    if not registry.loaded:
+        registry.load(session, version)
+    if registry.contains(name, version):
+        return True
+    db_class = session.exec(
+        select(CreatureClass).where(CreatureClass.name == name)
+    ).first()
+    if db_class:
+        registry.put(db_class)
+    return db_class is not None
+
+
+def insert_missing_classes(session: Session, rows: list[dict]) -> list[str]:
+    """Insert the classes whose name is not taken yet; returns the new names.
+
+    One INSERT ... ON CONFLICT DO NOTHING, so it is safe to run from
+    several processes at once and costs a single statement when every
+    class already exists.
+    """
+    if not rows:
+        return []
+    insert = DIALECT_INSERTS[session.get_bind().dialect.name]
+    statement = (
+        insert(CreatureClass)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(CreatureClass.name)
+    )
+    inserted = list(session.exec(statement).scalars())
+    if inserted:
+        versions.bump(session, versions.CLASSES)
+    session.commit()
+    if inserted:
+        # Reloaded on next use rather than patched row by row
+        registry.invalidate()
+    return inserted
+
+
+def seed_default_classes(session: Session) -> list[str]:
+    return insert_missing_classes(session, DEFAULT_CLASSES)
 
 
 def create_class(session: Session, class_data: CreatureClassCreate) -> CreatureClass:
@@ -18,26 +217,41 @@ def create_class(session: Session, class_data: CreatureClassCreate) -> CreatureC
 
     db_class = CreatureClass.model_validate(class_data)
     session.add(db_class)
+    version = versions.bump(session, versions.CLASSES)
     session.commit()
     session.refresh(db_class)
+    registry.put(db_class)
+    registry.advance(version)
     return db_class
 
 
-def list_classes(session: Session) -> list[CreatureClass]:
-    return session.exec(select(CreatureClass)).all()
+def list_classes(
+    session: Session, version: int | None = None
+) -> list[CreatureClassRead]:
+    if version is None:
+        version = versions.current(session, versions.CLASSES)
+    classes = registry.snapshot(version)
+    if classes is None:
+        classes = registry.load(session, version)
+    return classes
 
 
 def delete_class(session: Session, class_id: int):
     class_item = session.get(CreatureClass, class_id)
     if not class_item:
         raise HTTPException(status_code=404, detail="Class not found")
+    name = class_item.name
     session.delete(class_item)
+    version = versions.bump(session, versions.CLASSES)
     session.commit()
+    registry.discard(name)
+    registry.advance(version)
 
 
 def update_class(
     session: Session, class_id: int, class_update: CreatureClassUpdate
-) -> CreatureClass:
+) -> tuple[CreatureClass, int]:
+    """Update a class; returns it with the number of creatures renamed."""
     db_class = session.get(CreatureClass, class_id)
     if not db_class:
         raise HTTPException(status_code=404, detail="Class not found")
@@ -54,15 +268,25 @@ def update_class(
 
     session.add(db_class)
 
-    # Cascade update if name changed
+    # Cascade update if name changed: one set-based UPDATE in the same
+    # transaction instead of loading and flushing every creature
+    creatures_updated = 0
+    tables = [versions.CLASSES]
     if name_changed:
-        creatures = session.exec(
-            select(Creature).where(Creature.creature_type == old_name)
-        ).all()
-        for c in creatures:
-            c.creature_type = new_name
-            session.add(c)
+        result = session.exec(
+            update(Creature)
+            .where(Creature.creature_type == old_name)
+            .values(creature_type=new_name)
+        )
+        creatures_updated = result.rowcount
+        if creatures_updated:
+            tables.append(versions.CREATURES)
 
+    version = versions.bump_all(session, tables)[versions.CLASSES]
     session.commit()
     session.refresh(db_class)
-    return db_class
+    if name_changed:
+        registry.discard(old_name)
+    registry.put(db_class)
+    registry.advance(version)
+    return db_class, creatures_updated
@@ -1,53 +1,208 @@
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
 from fastapi import HTTPException
-from sqlmodel import Session, select
-from app.models import Creature, CreatureCreate
-
-
-def create_creature(session: Session, creature: CreatureCreate) -> Creature:
+from sqlalchemy import case
+from sqlmodel import Session, func, insert, select
+from app.models import (
+    Creature,
+    CreatureBulkResult,
+    CreatureClass,
+    CreatureClassRead,
+    CreatureCreate,
+    CreatureFilter,
+    CreatureStats,
+)
+from app.services import classes, versions
+
+# Default "Other" styling for classes registered on the fly
+DEFAULT_CLASS_STYLE = {
+    "color": "rgba(127,19,236,0.1)",
+    "border_color": "rgba(127,19,236,0.2)",
+    "text_color": "#ad92c9",
+}
+
+
+def avatar_url(name: str) -> str:
+    # Use DiceBear Identicon as the standard avatar generator
+    return f"https://api.dicebear.com/7.x/identicon/svg?seed={quote(name)}"
+
+
+def apply_defaults(creature: CreatureCreate, now: str | None = None) -> CreatureCreate:
     # Auto-generate AI Avatar URL if not provided
     if not creature.image_url:
-        from urllib.parse import quote
-
-        # Use DiceBear Identicon as the standard avatar generator
-        safe_name = quote(creature.name)
-        creature.image_url = (
-            f"https://api.dicebear.com/7.x/identicon/svg?seed={safe_name}"
-        )
+        creature.image_url = avatar_url(creature.name)
 
     # Auto-stamp
-    creature.last_modify = datetime.now(timezone.utc).isoformat()
+    creature.last_modify = now or datetime.now(timezone.utc).isoformat()
+    return creature
+
+
+def create_creature(session: Session, creature: CreatureCreate) -> Creature:
+    apply_defaults(creature)
 
     # --- AUTO-REGISTER CLASS ---
     # If the creature_type is not in CreatureClass table, add it.
-    from app.models import CreatureClass
-
-    existing_class = session.exec(
-        select(CreatureClass).where(CreatureClass.name == creature.creature_type)
-    ).first()
-    if not existing_class:
-        # Default "Other" styling
-        new_class = CreatureClass(
-            name=creature.creature_type,
-            color="rgba(127,19,236,0.1)",
-            border_color="rgba(127,19,236,0.2)",
-            text_color="#ad92c9",
-        )
+    new_class = None
+    tables = [versions.CREATURES]
+    if not classes.class_exists(session, creature.creature_type):
+        new_class = CreatureClass(name=creature.creature_type, **DEFAULT_CLASS_STYLE)
         session.add(new_class)
         # We don't need to refresh new_class here as long as it's committed with the creature
+        tables.append(versions.CLASSES)
 
     db_creature = Creature.model_validate(creature)
     session.add(db_creature)
+    bumped = versions.bump_all(session, tables)
+    if new_class is not None:
+        # Snapshot the class before commit expires it, saving a reload
+        session.flush()
+        class_read = CreatureClassRead.model_validate(new_class)
     session.commit()
     session.refresh(db_creature)
+    if new_class is not None:
+        classes.registry.put(class_read)
+        classes.registry.advance(bumped[versions.CLASSES])
     return db_creature
 
 
-def list_creatures(session: Session) -> list[Creature]:
-    creatures = session.exec(select(Creature)).all()
+def bulk_create_creatures(
+    session: Session, creatures: list[CreatureCreate], batch_size: int = 1000
+) -> CreatureBulkResult:
+    """Insert many creatures with a fixed number of statements.
+
+    Unknown classes are registered with one INSERT ... ON CONFLICT DO
+    NOTHING, so concurrent uploads sharing a new class do not collide;
+    creatures are inserted batch_size rows at a time, one transaction per
+    batch.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    rows = [apply_defaults(c, now).model_dump() for c in creatures]
+
+    # Distinct types in first-seen order so the response is stable
+    types = list(dict.fromkeys(row["creature_type"] for row in rows))
+    created = set(
+        classes.insert_missing_classes(
+            session, [{"name": name, **DEFAULT_CLASS_STYLE} for name in types]
+        )
+    )
+    missing = [t for t in types if t in created]
+
+    for start in range(0, len(rows), batch_size):
+        session.exec(insert(Creature), params=rows[start : start + batch_size])
+        versions.bump(session, versions.CREATURES)
+        session.commit()
+
+    return CreatureBulkResult(created=len(rows), classes_created=missing)
+
+
+def apply_filters(statement, filters: CreatureFilter | None):
+    """Translate dashboard filters into WHERE clauses on the creature table."""
+    if filters is None:
+        return statement
+    if filters.name:
+        statement = statement.where(
+            Creature.name.icontains(filters.name, autoescape=True)
+        )
+    if filters.creature_type:
+        statement = statement.where(Creature.creature_type.in_(filters.creature_type))
+    if filters.mythology:
+        statement = statement.where(Creature.mythology.in_(filters.mythology))
+    if filters.habitat:
+        statement = statement.where(Creature.habitat.in_(filters.habitat))
+    if filters.min_danger is not None:
+        statement = statement.where(Creature.danger_level >= filters.min_danger)
+    if filters.max_danger is not None:
+        statement = statement.where(Creature.danger_level <= filters.max_danger)
+    return statement
+
+
+def page_statement(
+    after_id: int | None = None,
+    limit: int | None = None,
+    filters: CreatureFilter | None = None,
+):
+    # Keyset pagination: seek past the cursor on the primary key instead of
+    # using OFFSET, so every page costs the same no matter how deep it is.
+    statement = apply_filters(select(Creature), filters).order_by(Creature.id)
+    if after_id is not None:
+        statement = statement.where(Creature.id > after_id)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def count_statement(filters: CreatureFilter | None = None):
+    return apply_filters(select(func.count()).select_from(Creature), filters)
+
+
+def count_creatures(session: Session, filters: CreatureFilter | None = None) -> int:
+    return session.exec(count_statement(filters)).one()
+
+
+def list_creatures(
+    session: Session,
+    after_id: int | None = None,
+    limit: int | None = None,
+    filters: CreatureFilter | None = None,
+) -> list[Creature]:
+    creatures = session.exec(page_statement(after_id, limit, filters)).all()
     return creatures
 
 
+CRITICAL_DANGER = 9
+
+
+def _count_by(session: Session, column) -> dict:
+    statement = select(column, func.count()).group_by(column).order_by(column)
+    return dict(session.exec(statement).all())
+
+
+def _count_since(since: datetime):
+    # last_modify holds UTC isoformat() stamps, which sort as strings;
+    # the upper bound drops non-dates such as the "Unknown" default
+    stamp = since.isoformat()
+    recent = (Creature.last_modify >= stamp) & (Creature.last_modify < "A")
+    return func.coalesce(func.sum(case((recent, 1), else_=0)), 0)
+
+
+def creature_stats(session: Session, now: datetime | None = None) -> CreatureStats:
+    """Header counts and filter facets, aggregated in SQL."""
+    now = now or datetime.now(timezone.utc)
+    start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    is_critical = Creature.danger_level >= CRITICAL_DANGER
+    total, critical, last_24h, this_month = session.exec(
+        select(
+            func.count(),
+            func.coalesce(func.sum(case((is_critical, 1), else_=0)), 0),
+            _count_since(now - timedelta(days=1)),
+            _count_since(start_of_month),
+        ).select_from(Creature)
+    ).one()
+    return CreatureStats(
+        total=total,
+        critical=critical,
+        added_last_24h=last_24h,
+        added_this_month=this_month,
+        danger_levels=_count_by(session, Creature.danger_level),
+        creature_types=_count_by(session, Creature.creature_type),
+        mythologies=_count_by(session, Creature.mythology),
+        habitats=_count_by(session, Creature.habitat),
+    )
+
+
+def iter_creatures(
+    session: Session, filters: CreatureFilter | None = None, batch_size: int = 500
+) -> Iterator[Creature]:
+    """Yield creatures in id order, buffering only batch_size rows at a time."""
+    statement = (
+        apply_filters(select(Creature), filters)
+        .order_by(Creature.id)
+        .execution_options(yield_per=batch_size)
+    )
+    yield from session.exec(statement)
+
+
 def get_creature(session: Session, creature_id: int) -> Creature:
     creature = session.get(Creature, creature_id)
     if not creature:
@@ -70,6 +225,7 @@ def update_creature(
     db_creature.last_modify = datetime.now(timezone.utc).isoformat()
 
     session.add(db_creature)
+    versions.bump(session, versions.CREATURES)
     session.commit()
     session.refresh(db_creature)
     return db_creature
@@ -81,4 +237,5 @@ def delete_creature(session: Session, creature_id: int) -> None:
         raise HTTPException(status_code=404, detail="Creature not found")
 
     session.delete(db_creature)
+    versions.bump(session, versions.CREATURES)
     session.commit()
@@ -0,0 +1,196 @@
+"""Ranked creature search over name, mythology and habitat."""
+
+import sys
+from itertools import product
+from sqlalchemy import column, func, literal_column, or_, table, text, union_all
+from sqlmodel import Session, select
+from app.models import (
+    POSTGRES_SEARCH_DOCUMENT,
+    SEARCH_COLUMNS,
+    SEARCH_TABLE,
+    Creature,
+    CreatureFilter,
+)
+from app.services.creatures import apply_filters
+
+# The trigram tokenizer needs at least three characters to use the index
+MIN_INDEXED_LENGTH = 3
+# Fuzzy matching ORs the query's 4-character substrings, so it needs 5+
+MIN_FUZZY_LENGTH = 5
+# Matches scored per stage, newest first. Scoring every match of a common
+# term (bm25 or otherwise) grows with the table; a window keeps it flat.
+RANK_WINDOW = 500
+
+_search_table = table(SEARCH_TABLE, column("rowid"), *map(column, SEARCH_COLUMNS))
+
+
+def _window(filters: CreatureFilter | None):
+    """The newest RANK_WINDOW index hits for :match that pass filters."""
+    statement = (
+        select(_search_table)
+        .where(text(f"{SEARCH_TABLE} MATCH :match"))
+        .order_by(_search_table.c.rowid.desc())
+        .limit(RANK_WINDOW)
+    )
+    if filters is None:
+        return statement
+    # Filter before the window is cut, so it holds RANK_WINDOW passing hits
+    statement = statement.join(Creature, Creature.id == _search_table.c.rowid)
+    return apply_filters(statement, filters)
+
+
+def _phrase(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+def fuzzy_grams(query: str) -> list[str]:
+    """The query's distinct 4-character substrings (spaces excluded)."""
+    query = query.lower()
+    grams = dict.fromkeys(query[i : i + 4] for i in range(len(query) - 3))
+    return [g for g in grams if " " not in g]
+
+
+def _name_rank(query: str, name: str) -> tuple:
+    # Name prefix, then name substring, then hits in the other columns;
+    # shorter names are closer matches
+    name = name.lower()
+    return (not name.startswith(query), query not in name, len(name))
+
+
+def _fetch(session: Session, ids: list[int]) -> list[Creature]:
+    rows = session.exec(select(Creature).where(Creature.id.in_(ids))).all()
+    by_id = {c.id: c for c in rows}
+    return [by_id[i] for i in ids if i in by_id]
+
+
+def _search_sqlite(
+    session: Session, query: str, limit: int, filters: CreatureFilter | None
+) -> list[Creature]:
+    connection = session.connection()
+    needle = query.lower()
+
+    # Exact and prefix name matches first, from the name index, so they win
+    # however old they are; the windows below only see the newest matches
+    spellings = {query, needle, query.upper(), query.title(), query.capitalize()}
+    prefixed = sorted(
+        _name_ranges(session, spellings, limit, filters).values(),
+        key=lambda c: (len(c.name), c.name.lower(), c.id),
+    )[:limit]
+    found = [c.id for c in prefixed]
+    seen = set(found)
+
+    ids = []
+    window = _window(filters)
+    params = {"match": _phrase(query)}
+    if len(found) < limit:
+        hits = [h for h in connection.execute(window, params) if h.rowid not in seen]
+        ranked = sorted(hits, key=lambda h: _name_rank(needle, h.name))
+        ids = [h.rowid for h in ranked[: limit - len(found)]]
+        seen.update(ids)
+
+    # Fill up with fuzzy hits sharing 4-character substrings with the query
+    # (a typo in a longer word), the most shared substrings first
+    grams = fuzzy_grams(query)
+    missing = limit - len(found) - len(ids)
+    if missing > 0 and len(query) >= MIN_FUZZY_LENGTH and grams:
+        params["match"] = " OR ".join(_phrase(g) for g in grams)
+        hits = [h for h in connection.execute(window, params) if h.rowid not in seen]
+
+        def fuzzy_rank(hit):
+            document = " ".join(hit[1:]).lower()
+            shared = sum(g in document for g in grams)
+            return (-shared, *_name_rank(needle, hit.name))
+
+        ids += [h.rowid for h in sorted(hits, key=fuzzy_rank)[:missing]]
+    return prefixed + (_fetch(session, ids) if ids else [])
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_postgres(
+    session: Session, query: str, limit: int, filters: CreatureFilter | None
+) -> list[Creature]:
+    document = literal_column(POSTGRES_SEARCH_DOCUMENT)
+    pattern = "%" + _escape_like(query) + "%"
+    statement = (
+        apply_filters(select(Creature), filters)
+        .where(or_(document.ilike(pattern, escape="\\"), document.op("%")(query)))
+        .order_by(
+            Creature.name.ilike(_escape_like(query) + "%", escape="\\").desc(),
+            func.similarity(document, query).desc(),
+        )
+        .limit(limit)
+    )
+    return list(session.exec(statement).all())
+
+
+def _prefix_end(prefix: str) -> str | None:
+    """The first string after every name starting with prefix, if any."""
+    # U+10FFFF has no successor: bump the last character below it instead
+    stem = prefix.rstrip(chr(sys.maxunicode))
+    if not stem:
+        return None
+    return stem[:-1] + chr(ord(stem[-1]) + 1)
+
+
+def _below(end: str | None) -> list:
+    return [] if end is None else [Creature.name < end]
+
+
+def _name_ranges(
+    session: Session,
+    prefixes: set[str],
+    limit: int,
+    filters: CreatureFilter | None = None,
+) -> dict[int, Creature]:
+    """Names starting with any of prefixes, in one query.
+
+    Each prefix is its own index range read in name order up to limit
+    (UNION ALL), so a common prefix never sorts all of its matches.
+    """
+    ranges = [
+        apply_filters(select(Creature.id), filters)
+        .where(Creature.name >= prefix, *_below(_prefix_end(prefix)))
+        .order_by(Creature.name)
+        .limit(limit)
+        .subquery()
+        for prefix in prefixes
+    ]
+    ids = union_all(*(select(r.c.id) for r in ranges))
+    statement = select(Creature).where(Creature.id.in_(ids))
+    return {c.id: c for c in session.exec(statement)}
+
+
+def _search_prefix(
+    session: Session, query: str, limit: int, filters: CreatureFilter | None
+) -> list[Creature]:
+    # The name index is case-sensitive, so scan one index range per
+    # upper/lower-case spelling of the (short) prefix and merge
+    spellings = {"".join(p) for p in product(*({c.lower(), c.upper()} for c in query))}
+    found = _name_ranges(session, spellings, limit, filters)
+    return sorted(found.values(), key=lambda c: (c.name.lower(), c.id))[:limit]
+
+
+def search_creatures(
+    session: Session,
+    query: str,
+    limit: int = 20,
+    filters: CreatureFilter | None = None,
+) -> list[Creature]:
+    """Best matches for query: prefix, substring, then fuzzy (typos).
+
+    Only creatures passing filters are ranked, so a narrow filter still
+    gets up to limit hits.
+    """
+    query = query.strip()
+    if not query:
+        return []
+    if filters is not None and not filters.model_dump(exclude_defaults=True):
+        filters = None  # keep the plain index scans when nothing is set
+    if len(query) < MIN_INDEXED_LENGTH:
+        return _search_prefix(session, query, limit, filters)
+    if session.get_bind().dialect.name == "postgresql":
+        return _search_postgres(session, query, limit, filters)
+    return _search_sqlite(session, query, limit, filters)
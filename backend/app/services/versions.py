@@ -0,0 +1,73 @@
+"""Per-table version markers behind the ETag / If-None-Match support."""
+
+import hashlib
+from collections.abc import Iterable
+from fastapi import HTTPException, Request, Response
+from sqlmodel import Session, select, update
+from app.models import Creature, CreatureClass, TableVersion
+
+CREATURES = Creature.__tablename__
+CLASSES = CreatureClass.__tablename__
+
+
+def current_statement(table: str):
+    return select(TableVersion.version).where(TableVersion.name == table)
+
+
+def bump_statement(table: str):
+    return (
+        update(TableVersion)
+        .where(TableVersion.name == table)
+        .values(version=TableVersion.version + 1)
+        .returning(TableVersion.version)
+    )
+
+
+def current(session: Session, table: str) -> int:
+    return session.exec(current_statement(table)).first() or 0
+
+
+def all_versions(session: Session) -> dict[str, int]:
+    return dict(session.exec(select(TableVersion.name, TableVersion.version)).all())
+
+
+def bump(session: Session, table: str) -> int:
+    """Increment the table's version inside the caller's transaction."""
+    return bump_all(session, [table])[table]
+
+
+def bump_all(session: Session, tables: Iterable[str]) -> dict[str, int]:
+    """Increment several versions, locking their rows in table name order.
+
+    Every writer takes the row locks in the same order, so two transactions
+    bumping the same tables cannot deadlock each other on Postgres. Call it
+    right before commit to hold the locks as briefly as possible.
+    """
+    return {
+        table: session.exec(bump_statement(table)).scalar_one()
+        for table in sorted(set(tables))
+    }
+
+
+def etag(request: Request, table: str, version: int | str) -> str:
+    # One version covers the whole table, so the tag also has to tell apart
+    # the different URLs (ids, filters, cursors) served from it
+    url = f"{request.url.path}?{request.url.query}"
+    digest = hashlib.sha1(url.encode()).hexdigest()[:12]
+    return f'"{table}-{version}-{digest}"'
+
+
+def check_not_modified(
+    request: Request, response: Response, table: str, version: int | str
+) -> None:
+    """Set the ETag and answer 304 when the client already holds it."""
+    tag = etag(request, table, version)
+    headers = {"ETag": tag, "Cache-Control": "no-cache"}
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    if tag in tags or "*" in tags:
+        raise HTTPException(status_code=304, headers=headers)
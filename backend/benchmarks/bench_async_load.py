@@ -0,0 +1,127 @@
+"""Load test: requests per second of the sync vs DB_ASYNC=1 database layer.
+
+Starts uvicorn once per mode against the same seeded SQLite file and
+drives it with concurrent keep-alive clients. Run from the backend dir:
+    uv run python -m benchmarks.bench_async_load --concurrency 64 --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models import Creature
+
+
+def seed(url: str, creatures: int) -> None:
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+    rows = [
+        {
+            "name": f"Creature {i}",
+            "mythology": random.choice(["Norse", "Greek", "Celtic"]),
+            "creature_type": random.choice(["Draconic", "Fae", "Abyssal"]),
+            "danger_level": random.randint(1, 10),
+            "habitat": "Unknown",
+            "last_modify": "Unknown",
+            "image_url": "",
+        }
+        for i in range(creatures)
+    ]
+    with Session(engine) as session:
+        session.exec(insert(Creature), params=rows)
+        session.commit()
+    engine.dispose()
+
+
+def start_server(url: str, async_db: bool, port: int) -> subprocess.Popen:
+    env = dict(os.environ, DATABASE_URL=url, DB_ASYNC="1" if async_db else "0")
+    cmd = [sys.executable, "-m", "uvicorn", "app.app:app", "--port", str(port)]
+    cmd += ["--log-level", "warning"]
+    return subprocess.Popen(cmd, env=env)
+
+
+async def wait_ready(base_url: str) -> None:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(100):
+            try:
+                await client.get("/")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+async def load(base_url: str, creatures: int, concurrency: int, duration: float):
+    latencies = []
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async def worker(client: httpx.AsyncClient):
+        while time.perf_counter() < deadline:
+            if random.random() < 0.5:
+                path = f"/creatures/?limit=50&after_id={random.randrange(creatures)}"
+            else:
+                path = f"/creatures/{random.randrange(1, creatures + 1)}"
+            start = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return latencies, elapsed
+
+
+def report(mode: str, latencies: list[float], elapsed: float) -> None:
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{mode:<6} {len(latencies) / elapsed:>9.1f} req/s"
+        f"  p50 {cuts[49] * 1000:>7.1f} ms  p95 {cuts[94] * 1000:>7.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--creatures", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'load.db')}"
+        seed(url, args.creatures)
+        base_url = f"http://127.0.0.1:{args.port}"
+        print(
+            f"{args.creatures} creatures, {args.concurrency} concurrent clients, "
+            f"{args.duration:.0f}s per mode"
+        )
+        for mode, async_db in (("sync", False), ("async", True)):
+            server = start_server(url, async_db, args.port)
+            try:
+                asyncio.run(wait_ready(base_url))
+                report(
+                    mode,
+                    *asyncio.run(
+                        load(base_url, args.creatures, args.concurrency, args.duration)
+                    ),
+                )
+            finally:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compare the class rename cascade: per-row ORM updates vs one bulk UPDATE.
+
+Run from the backend directory:
+    uv run python -m benchmarks.bench_class_rename --creatures 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models import Creature, CreatureClass, CreatureClassUpdate
+from app.services import classes as service
+
+
+def seed(engine, creatures: int) -> int:
+    """Create one class that owns every creature; returns its id."""
+    with Session(engine) as session:
+        db_class = CreatureClass(name="Class 0")
+        session.add(db_class)
+        session.commit()
+        rows = [
+            {
+                "name": f"Creature {i}",
+                "mythology": "Bench",
+                "creature_type": "Class 0",
+                "danger_level": i % 10 + 1,
+                "habitat": "Unknown",
+                "last_modify": "Unknown",
+                "image_url": "",
+            }
+            for i in range(creatures)
+        ]
+        session.exec(insert(Creature), params=rows)
+        session.commit()
+        return db_class.id
+
+
+def legacy_rename(session: Session, class_id: int, new_name: str) -> int:
+    """The previous cascade: load every creature and update it one by one."""
+    db_class = session.get(CreatureClass, class_id)
+    old_name = db_class.name
+    db_class.name = new_name
+    session.add(db_class)
+    creatures = session.exec(
+        select(Creature).where(Creature.creature_type == old_name)
+    ).all()
+    for c in creatures:
+        c.creature_type = new_name
+        session.add(c)
+    session.commit()
+    return len(creatures)
+
+
+def bulk_rename(session: Session, class_id: int, new_name: str) -> int:
+    _, updated = service.update_class(
+        session, class_id, CreatureClassUpdate(name=new_name)
+    )
+    return updated
+
+
+def run(name: str, rename, creatures: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        class_id = seed(engine, creatures)
+        with Session(engine) as session:
+            start = time.perf_counter()
+            updated = rename(session, class_id, "Class 1")
+            elapsed = time.perf_counter() - start
+        engine.dispose()
+    print(f"{name:<8} {updated:>9} rows  {elapsed * 1000:>10.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--creatures", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"Renaming a class owning {args.creatures} creatures (SQLite file)")
+    run("legacy", legacy_rename, args.creatures)
+    run("bulk", bulk_rename, args.creatures)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Time ranked search queries against the FTS5 trigram index.
+
+Run from the backend directory:
+    uv run python -m benchmarks.bench_search --creatures 1000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models import Creature
+from app.services.search import search_creatures
+
+SYLLABLES = ["dra", "gon", "ba", "si", "lisk", "kra", "ken", "wy", "vern", "py"]
+MYTHOLOGIES = ["Norse", "Greek", "Celtic", "Japanese", "Aztec", "Egyptian"]
+HABITATS = ["Mountains", "Ocean", "Forest", "Desert", "Caves", "Swamp"]
+QUERIES = ["dragon", "lisk", "kraken", "dr", "gonba", "basilsk", "ocean", "norse"]
+
+
+def seed(engine, creatures: int, batch: int = 50_000) -> None:
+    rng = random.Random(42)
+    with Session(engine) as session:
+        for start in range(0, creatures, batch):
+            rows = [
+                {
+                    "name": "".join(rng.choices(SYLLABLES, k=3)).title()
+                    + f" {start + i}",
+                    "mythology": rng.choice(MYTHOLOGIES),
+                    "creature_type": "Bench",
+                    "danger_level": rng.randint(1, 10),
+                    "habitat": rng.choice(HABITATS),
+                    "last_modify": "Unknown",
+                    "image_url": "",
+                }
+                for i in range(min(batch, creatures - start))
+            ]
+            session.exec(insert(Creature), params=rows)
+            session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--creatures", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        start = time.perf_counter()
+        seed(engine, args.creatures)
+        print(
+            f"Seeded {args.creatures} creatures in {time.perf_counter() - start:.1f} s"
+        )
+
+        with Session(engine) as session:
+            for query in QUERIES:
+                timings = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    found = search_creatures(session, query, args.limit)
+                    timings.append((time.perf_counter() - start) * 1000)
+                print(
+                    f"{query!r:<12} {len(found):>3} hits  "
+                    f"median {statistics.median(timings):>8.2f} ms  "
+                    f"max {max(timings):>8.2f} ms"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""Latency and throughput of the main endpoints on synthetic bestiaries.
+
+Seeds a SQLite file per size, then drives the real app in-process
+(TestClient) and through uvicorn over HTTP with one keep-alive client,
+timing list, get, create, update, delete, class rename and the class
+listing. Results are written as JSON; pass an earlier file to --compare
+to see regressions between commits. Run from the backend directory:
+    uv run python -m benchmarks.bench_suite --sizes 1000 100000 1000000
+    uv run python -m benchmarks.bench_suite --sizes 1000 --compare old.json
+
+For concurrent load against the sync and async layers see bench_async_load.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlmodel import Session, create_engine
+
+from app.app import app
+from app.db import enable_sqlite_pragmas, get_session, pool_options
+from app.services.classes import registry
+from benchmarks.bench_async_load import start_server, wait_ready
+from seed_creatures import seed_creatures
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+OPERATIONS = ["list", "get", "create", "update", "delete", "rename", "classes"]
+TRANSPORTS = ["inprocess", "uvicorn"]
+MYTHOLOGIES = ["Norse", "Greek", "Celtic", "Japanese", "Aztec", "Egyptian"]
+HABITATS = ["Mountains", "Ocean", "Forest", "Desert", "Caves", "Swamp"]
+# Renames touch every creature of a class, so they get fewer samples
+RENAME_REQUESTS = 20
+PAGE_SIZE = 50
+
+
+def seed(url: str, creatures: int, classes: int) -> None:
+    engine = create_engine(url)
+    # Class ids follow the weights' order: "Class 0" gets id 1
+    weights = {f"Class {i}": 1 for i in range(classes)}
+    seed_creatures(engine, creatures, classes=weights, progress=lambda _: None)
+    engine.dispose()
+
+
+def payload(rng: random.Random, name: str) -> dict:
+    return {
+        "name": name,
+        "mythology": rng.choice(MYTHOLOGIES),
+        # Class 0 is never renamed, so creates never register a new class
+        "creature_type": "Class 0",
+        "danger_level": rng.randint(1, 10),
+        "habitat": rng.choice(HABITATS),
+    }
+
+
+class Workload:
+    """Request generators for each operation, sharing the ids they create."""
+
+    def __init__(self, creatures: int, class_count: int, tag: str, seed: int = 7):
+        self.creatures = creatures
+        self.class_count = class_count
+        self.tag = tag  # keeps renamed class names unique across runs
+        self.rng = random.Random(seed)
+        self.created: list[int] = []
+        self.renames = 0
+
+    def list(self, client):
+        after_id = self.rng.randrange(self.creatures)
+        return client.get(
+            "/creatures/", params={"limit": PAGE_SIZE, "after_id": after_id}
+        )
+
+    def get(self, client):
+        return client.get(f"/creatures/{self.rng.randrange(1, self.creatures + 1)}")
+
+    def create(self, client):
+        response = client.post("/creatures/", json=payload(self.rng, "Bench Beast"))
+        self.created.append(response.json()["id"])
+        return response
+
+    def update(self, client):
+        creature_id = self.rng.randrange(1, self.creatures + 1)
+        return client.put(
+            f"/creatures/{creature_id}",
+            json=payload(self.rng, f"Creature {creature_id}"),
+        )
+
+    def delete(self, client):
+        return client.delete(f"/creatures/{self.created.pop()}")
+
+    def rename(self, client):
+        self.renames += 1
+        class_id = self.renames % (self.class_count - 1) + 2  # skip Class 0 (id 1)
+        name = f"{self.tag} {self.renames}"
+        return client.put(f"/classes/{class_id}", json={"name": name})
+
+    def classes(self, client):
+        return client.get("/classes/")
+
+
+def run_operations(client, workload: Workload, requests: int, warmup: int) -> list:
+    results = []
+    for op in OPERATIONS:
+        # Deletes consume the ids that create made, so they share its count
+        count = RENAME_REQUESTS if op == "rename" else requests
+        call = getattr(workload, op)
+        for _ in range(warmup if op not in ("create", "delete", "rename") else 0):
+            call(client).raise_for_status()
+
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(count):
+            start = time.perf_counter()
+            call(client).raise_for_status()
+            latencies.append(time.perf_counter() - start)
+        elapsed = time.perf_counter() - started
+        results.append({"op": op, **summarize(latencies, elapsed)})
+    return results
+
+
+def summarize(latencies: list[float], elapsed: float) -> dict:
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "throughput": round(len(latencies) / elapsed, 1),
+    }
+
+
+def bench_inprocess(url: str, workload: Workload, requests: int, warmup: int) -> list:
+    engine = create_engine(
+        url, connect_args={"check_same_thread": False}, **pool_options(url)
+    )
+    enable_sqlite_pragmas(engine)
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    # The lifespan hook would open the configured database; load what it
+    # loads from the seeded file instead
+    with Session(engine) as session:
+        registry.load(session)
+    app.dependency_overrides[get_session] = session_override
+    try:
+        return run_operations(TestClient(app), workload, requests, warmup)
+    finally:
+        app.dependency_overrides.clear()
+        registry.invalidate()
+        engine.dispose()
+
+
+def bench_uvicorn(
+    url: str, workload: Workload, requests: int, warmup: int, port: int
+) -> list:
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(url, async_db=False, port=port)
+    try:
+        asyncio.run(wait_ready(base_url))
+        with httpx.Client(base_url=base_url) as client:
+            return run_operations(client, workload, requests, warmup)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def git_commit() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def print_results(results: list[dict]) -> None:
+    print(
+        f"{'size':>9} {'transport':<10} {'op':<8} {'p50 ms':>9} {'p95 ms':>9}"
+        f" {'p99 ms':>9} {'req/s':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['size']:>9} {r['transport']:<10} {r['op']:<8} {r['p50_ms']:>9.2f}"
+            f" {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['throughput']:>9.1f}"
+        )
+
+
+def compare(base: dict, results: list[dict], threshold: float) -> bool:
+    """Print p50/p95 changes against base; True if any p95 regressed past threshold."""
+    old = {(r["size"], r["transport"], r["op"]): r for r in base["results"]}
+    regressed = False
+    print(f"\nAgainst {base['commit']} ({base['created']}):")
+    for r in results:
+        before = old.get((r["size"], r["transport"], r["op"]))
+        if before is None:
+            continue
+        deltas = [
+            (r[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            for key in ("p50_ms", "p95_ms")
+        ]
+        flag = ""
+        if deltas[1] > threshold:
+            regressed = True
+            flag = "  REGRESSION"
+        print(
+            f"{r['size']:>9} {r['transport']:<10} {r['op']:<8}"
+            f" p50 {deltas[0]:>+7.1f}%  p95 {deltas[1]:>+7.1f}%{flag}"
+        )
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--transports", nargs="+", choices=TRANSPORTS, default=TRANSPORTS
+    )
+    parser.add_argument(
+        "--requests", type=int, default=200, help="samples per operation"
+    )
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--classes", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--output", help="JSON results file (default: bench-<commit>.json)"
+    )
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20.0,
+        help="p95 regression %% that fails --compare",
+    )
+    args = parser.parse_args()
+
+    commit = git_commit()
+    results = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+            start = time.perf_counter()
+            seed(url, size, args.classes)
+            print(f"Seeded {size} creatures in {time.perf_counter() - start:.1f} s")
+            for transport in args.transports:
+                workload = Workload(size, args.classes, tag=transport)
+                if transport == "inprocess":
+                    rows = bench_inprocess(url, workload, args.requests, args.warmup)
+                else:
+                    rows = bench_uvicorn(
+                        url, workload, args.requests, args.warmup, args.port
+                    )
+                results += [{"size": size, "transport": transport, **r} for r in rows]
+
+    print_results(results)
+    output = args.output or f"bench-{commit}.json"
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "commit": commit,
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "requests": args.requests,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"Wrote {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(json.load(f), results, args.threshold):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
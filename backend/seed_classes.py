@@ -1,79 +1,18 @@
-from sqlmodel import Session, select
+from sqlmodel import Session
 from app.db import engine
-from app.models import CreatureClass
+from app.services.classes import DEFAULT_CLASSES, seed_default_classes
 
-DEFAULT_CLASSES = [
-    {
-        "name": "Draconic",
-        "color": "rgba(255, 107, 107, 0.2)",
-        "border_color": "rgba(255, 107, 107, 0.8)",
-        "text_color": "#ff6b6b",
-    },
-    {
-        "name": "Chimeric",
-        "color": "rgba(255, 159, 67, 0.2)",
-        "border_color": "rgba(255, 159, 67, 0.8)",
-        "text_color": "#ff9f43",
-    },
-    {
-        "name": "Fae",
-        "color": "rgba(254, 202, 87, 0.2)",
-        "border_color": "rgba(254, 202, 87, 0.8)",
-        "text_color": "#feca57",
-    },
-    {
-        "name": "Titanic",
-        "color": "rgba(72, 219, 251, 0.2)",
-        "border_color": "rgba(72, 219, 251, 0.8)",
-        "text_color": "#48dbfb",
-    },
-    {
-        "name": "Abyssal",
-        "color": "rgba(84, 160, 255, 0.2)",
-        "border_color": "rgba(84, 160, 255, 0.8)",
-        "text_color": "#54a0ff",
-    },
-    {
-        "name": "Ethereal",
-        "color": "rgba(200, 214, 229, 0.2)",
-        "border_color": "rgba(200, 214, 229, 0.8)",
-        "text_color": "#c8d6e5",
-    },
-    {
-        "name": "Mythic Beasts",
-        "color": "rgba(95, 39, 205, 0.2)",
-        "border_color": "rgba(95, 39, 205, 0.8)",
-        "text_color": "#5f27cd",
-    },
-    {
-        "name": "Other",
-        "color": "rgba(131, 149, 167, 0.2)",
-        "border_color": "rgba(131, 149, 167, 0.8)",
-        "text_color": "#8395a7",
-    },
-]
+__all__ = ["DEFAULT_CLASSES", "seed_classes"]
 
 
 def seed_classes():
+    # One INSERT ... ON CONFLICT DO NOTHING, safe to run alongside other
+    # instances; the app can also do this at startup with SEED_CLASSES=1
     with Session(engine) as session:
-        print("Checking for existing classes...")
-        added_count = 0
-        for class_data in DEFAULT_CLASSES:
-            statement = select(CreatureClass).where(
-                CreatureClass.name == class_data["name"]
-            )
-            results = session.exec(statement).first()
-
-            if not results:
-                print(f"Adding new class: {class_data['name']}")
-                new_class = CreatureClass(**class_data)
-                session.add(new_class)
-                added_count += 1
-            else:
-                print(f"Class already exists: {class_data['name']}")
-
-        session.commit()
-        print(f"\nSeeding complete. Added {added_count} new classes.")
+        added = seed_default_classes(session)
+    for name in added:
+        print(f"Added new class: {name}")
+    print(f"\nSeeding complete. Added {len(added)} new classes.")
 
 
 if __name__ == "__main__":
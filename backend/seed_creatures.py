@@ -0,0 +1,301 @@
+"""Generate a synthetic bestiary and bulk-load it.
+
+The same --seed always produces the same creatures; only the timestamps
+move with the clock. Rows are written batch by batch with executemany
+(SQLite) or COPY (Postgres via psycopg 3). Examples, from the backend dir:
+    uv run python seed_creatures.py 1000000 --seed 7 --replace
+    uv run python seed_creatures.py 5000 --classes "Draconic=5,Fae=1" --danger "1=9,10=1"
+    DATABASE_URL=postgresql://... uv run python seed_creatures.py 1000000
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.db import DATABASE_URL, enable_sqlite_pragmas
+from app.models import SEARCH_TABLE, create_search_index
+from app.services import versions
+from app.services.classes import DEFAULT_CLASSES, insert_missing_classes
+from app.services.creatures import DEFAULT_CLASS_STYLE, avatar_url
+
+# Column order of the generated rows
+COLUMNS = (
+    "name",
+    "mythology",
+    "creature_type",
+    "danger_level",
+    "habitat",
+    "last_modify",
+    "image_url",
+)
+
+# Relative weights; "Other" stays rare like in a hand-curated bestiary
+DEFAULT_CLASS_WEIGHTS = {c["name"]: 1 for c in DEFAULT_CLASSES} | {"Other": 0.25}
+DEFAULT_MYTHOLOGY_WEIGHTS = {
+    "Greek": 6,
+    "Norse": 5,
+    "Celtic": 4,
+    "Japanese": 4,
+    "Egyptian": 3,
+    "Slavic": 3,
+    "Chinese": 3,
+    "Aztec": 2,
+    "Hindu": 2,
+    "Mesopotamian": 1,
+}
+# Most creatures are a nuisance; few are catastrophic
+DEFAULT_DANGER_WEIGHTS = {
+    1: 18,
+    2: 16,
+    3: 14,
+    4: 12,
+    5: 10,
+    6: 9,
+    7: 7,
+    8: 6,
+    9: 5,
+    10: 3,
+}
+HABITATS = [
+    "Mountains",
+    "Ocean",
+    "Forest",
+    "Desert",
+    "Caves",
+    "Swamp",
+    "Tundra",
+    "Volcano",
+    "Sky",
+    "Underworld",
+    "Ruins",
+    "Rivers",
+]
+ADJECTIVES = [
+    "Ashen", "Black", "Blood", "Bone", "Crimson", "Dread", "Dusk", "Ember",
+    "Frost", "Gilded", "Grave", "Hollow", "Iron", "Jade", "Moon", "Night",
+    "Pale", "Rune", "Salt", "Shadow", "Silver", "Storm", "Sun", "Thorn",
+    "Thunder", "Tide", "Venom", "Void", "Whispering", "Wild",
+]  # fmt: skip
+NOUNS = [
+    "Basilisk", "Banshee", "Behemoth", "Chimera", "Cockatrice", "Djinn",
+    "Drake", "Gorgon", "Griffin", "Harpy", "Hydra", "Kelpie", "Kitsune",
+    "Kraken", "Leviathan", "Lich", "Manticore", "Naga", "Oni", "Phoenix",
+    "Roc", "Selkie", "Sphinx", "Tengu", "Troll", "Wendigo", "Wraith",
+    "Wyrm", "Wyvern", "Yeti",
+]  # fmt: skip
+
+
+def parse_weights(spec: str, cast: Callable = str) -> dict:
+    """'Draconic=5,Fae=2,Other' -> {'Draconic': 5.0, 'Fae': 2.0, 'Other': 1.0}"""
+    weights = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        key, _, weight = item.partition("=")
+        weights[cast(key.strip())] = float(weight) if weight else 1.0
+    if not weights or any(w < 0 for w in weights.values()):
+        raise argparse.ArgumentTypeError(f"invalid weights: {spec!r}")
+    return weights
+
+
+def generate(
+    count: int,
+    seed: int = 42,
+    classes: dict[str, float] = DEFAULT_CLASS_WEIGHTS,
+    mythologies: dict[str, float] = DEFAULT_MYTHOLOGY_WEIGHTS,
+    dangers: dict[int, float] = DEFAULT_DANGER_WEIGHTS,
+    days: int = 365,
+    batch_size: int = 50_000,
+) -> Iterator[list[tuple]]:
+    """Yield batches of creature rows (in COLUMNS order).
+
+    Timestamps rise with the row number across the last `days` days, so
+    the newest ids are also the most recently modified, as in real use.
+    """
+    rng = random.Random(seed)
+    end = datetime.now(timezone.utc)
+    step = timedelta(days=days) / max(count, 1)
+    start = end - timedelta(days=days)
+    avatars: dict[str, str] = {}  # names repeat, quoting them once is enough
+
+    for offset in range(0, count, batch_size):
+        n = min(batch_size, count - offset)
+        names = [
+            f"{adjective} {noun}"
+            for adjective, noun in zip(
+                rng.choices(ADJECTIVES, k=n), rng.choices(NOUNS, k=n)
+            )
+        ]
+        columns = zip(
+            names,
+            rng.choices(list(mythologies), weights=list(mythologies.values()), k=n),
+            rng.choices(list(classes), weights=list(classes.values()), k=n),
+            rng.choices(list(dangers), weights=list(dangers.values()), k=n),
+            rng.choices(HABITATS, k=n),
+        )
+        yield [
+            (
+                name,
+                mythology,
+                creature_type,
+                danger,
+                habitat,
+                (start + step * (offset + i)).isoformat(),
+                avatars.get(name) or avatars.setdefault(name, avatar_url(name)),
+            )
+            for i, (name, mythology, creature_type, danger, habitat) in enumerate(
+                columns
+            )
+        ]
+
+
+def register_classes(engine: Engine, names: list[str]) -> list[str]:
+    """Insert the classes that do not exist yet, with their default style."""
+    styles = {c["name"]: c for c in DEFAULT_CLASSES}
+    with Session(engine) as session:
+        return insert_missing_classes(
+            session,
+            [styles.get(name, {"name": name, **DEFAULT_CLASS_STYLE}) for name in names],
+        )
+
+
+def _copy_rows(connection, rows: list[tuple]) -> bool:
+    """COPY the rows in on psycopg 3; False if the driver cannot."""
+    cursor = connection.connection.cursor()
+    if not hasattr(cursor, "copy"):
+        return False
+    with cursor.copy(f"COPY creature ({', '.join(COLUMNS)}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+    return True
+
+
+def _insert_rows(connection, rows: list[tuple]) -> None:
+    placeholders = ", ".join("?" for _ in COLUMNS)
+    if connection.dialect.paramstyle != "qmark":
+        placeholders = ", ".join("%s" for _ in COLUMNS)
+    connection.exec_driver_sql(
+        f"INSERT INTO creature ({', '.join(COLUMNS)}) VALUES ({placeholders})", rows
+    )
+
+
+def seed_creatures(
+    engine: Engine,
+    count: int,
+    *,
+    replace: bool = False,
+    progress: Callable[[str], None] = print,
+    **generate_options,
+) -> int:
+    """Load `count` generated creatures; returns how many were written.
+
+    On SQLite a big load (at least as many rows as the table holds) drops
+    the search index triggers and rebuilds the index once at the end, which
+    is several times faster than indexing row by row.
+    """
+    SQLModel.metadata.create_all(engine)
+    classes = list(generate_options.get("classes", DEFAULT_CLASS_WEIGHTS))
+    new_classes = register_classes(engine, classes)
+    if new_classes:
+        progress(f"Registered classes: {', '.join(new_classes)}")
+
+    sqlite = engine.dialect.name == "sqlite"
+    with engine.begin() as connection:
+        existing = 0
+        if not replace:
+            existing = connection.exec_driver_sql(
+                "SELECT count(*) FROM creature"
+            ).scalar_one()
+        reindex = sqlite and count >= existing
+        if reindex:
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ai")
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ad")
+
+    written = 0
+    try:
+        if replace:
+            with engine.begin() as connection:
+                connection.exec_driver_sql(
+                    "DELETE FROM creature"
+                    if sqlite
+                    else "TRUNCATE creature RESTART IDENTITY"
+                )
+        started = time.perf_counter()
+        for rows in generate(count, **generate_options):
+            # One transaction per batch keeps locks short on a live database
+            with engine.begin() as connection:
+                if sqlite or not _copy_rows(connection, rows):
+                    _insert_rows(connection, rows)
+            written += len(rows)
+            rate = written / (time.perf_counter() - started)
+            progress(f"{written}/{count} creatures ({rate:,.0f}/s)")
+    finally:
+        # Also after a failure or Ctrl-C: without the triggers and a rebuilt
+        # index, search would miss these rows and every later write
+        if reindex:
+            progress("Rebuilding the search index...")
+            with engine.begin() as connection:
+                connection.exec_driver_sql(
+                    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"
+                )
+                create_search_index(connection)  # restores the dropped triggers
+        with Session(engine) as session:
+            # Running apps and dashboards refetch on the next version check
+            # (register_classes already bumped the classes version)
+            versions.bump(session, versions.CREATURES)
+            session.commit()
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("count", type=int, help="number of creatures to generate")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--classes",
+        type=parse_weights,
+        default=DEFAULT_CLASS_WEIGHTS,
+        help="class weights, e.g. 'Draconic=5,Fae=2,Other=1'",
+    )
+    parser.add_argument(
+        "--mythologies",
+        type=parse_weights,
+        default=DEFAULT_MYTHOLOGY_WEIGHTS,
+        help="mythology weights, e.g. 'Greek=3,Norse=1'",
+    )
+    parser.add_argument(
+        "--danger",
+        type=lambda spec: parse_weights(spec, int),
+        default=DEFAULT_DANGER_WEIGHTS,
+        help="danger level weights, e.g. '1=10,5=5,10=1'",
+    )
+    parser.add_argument("--days", type=int, default=365, help="timestamp spread")
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument(
+        "--replace", action="store_true", help="delete existing creatures first"
+    )
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    enable_sqlite_pragmas(engine)
+    start = time.perf_counter()
+    written = seed_creatures(
+        engine,
+        args.count,
+        replace=args.replace,
+        seed=args.seed,
+        classes=args.classes,
+        mythologies=args.mythologies,
+        dangers=args.danger,
+        days=args.days,
+        batch_size=args.batch_size,
+    )
+    print(f"Seeded {written} creatures in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
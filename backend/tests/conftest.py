@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import Engine
+
+from app.profiler import profile_engine, profile_statements
+
+# Every engine the tests create, including the per-module in-memory ones
+profile_engine(Engine)
+
+
+@pytest.fixture
+def sql_budget():
+    """Fail when a block runs more SQL statements than its budget.
+
+        with sql_budget(3):
+            client.get("/creatures/1")
+
+    Repeated statement shapes (likely N+1 loops) fail too unless
+    allow_repeats=True.
+    """
+
+    @contextmanager
+    def budget(max_statements: int, allow_repeats: bool = False):
+        with profile_statements() as profile:
+            yield profile
+        assert profile.count <= max_statements, (
+            f"SQL budget {max_statements} exceeded:\n{profile.report()}"
+        )
+        if not allow_repeats:
+            assert not profile.repeated(), f"Likely N+1:\n{profile.report()}"
+
+    return budget
@@ -0,0 +1,146 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db import get_async_session, get_session, to_async_url
+from app.routers import async_classes, async_creatures, classes, creatures
+from app.services.classes import registry
+
+# Same router order as app.app in DB_ASYNC mode
+app = FastAPI()
+app.include_router(async_creatures.router)
+app.include_router(async_classes.router)
+app.include_router(creatures.router)
+app.include_router(classes.router)
+
+
+@pytest.fixture(name="client")
+def client_fixture(tmp_path):
+    # A file database so the sync and async engines see the same data
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    async_engine = create_async_engine(to_async_url(url))
+    SQLModel.metadata.create_all(engine)
+    registry.invalidate()
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    async def get_async_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_async_session] = get_async_session_override
+    with TestClient(app) as client:
+        yield client
+        client.portal.call(async_engine.dispose)
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
+def test_to_async_url():
+    assert to_async_url("sqlite:///creatures.db") == "sqlite+aiosqlite:///creatures.db"
+    assert (
+        to_async_url("postgresql://user:pw@host/db")
+        == "postgresql+psycopg://user:pw@host/db"
+    )
+
+
+def test_async_creature_crud(client: TestClient):
+    res = client.post(
+        "/creatures/",
+        json={
+            "name": "Async Dragon",
+            "mythology": "Norse",
+            "creature_type": "Async Class",
+            "danger_level": 9,
+        },
+    )
+    assert res.status_code == 200
+    creature = res.json()
+    assert "api.dicebear.com" in creature["image_url"]
+    assert [c["name"] for c in client.get("/classes/").json()] == ["Async Class"]
+
+    res = client.put(
+        f"/creatures/{creature['id']}",
+        json={
+            "name": "Async Wyrm",
+            "mythology": "Norse",
+            "creature_type": "Async Class",
+            "danger_level": 10,
+        },
+    )
+    assert res.json()["name"] == "Async Wyrm"
+    assert client.get(f"/creatures/{creature['id']}").json()["danger_level"] == 10
+
+    assert client.delete(f"/creatures/{creature['id']}").status_code == 200
+    assert client.get(f"/creatures/{creature['id']}").status_code == 404
+
+
+def test_async_list_paginates_and_filters(client: TestClient):
+    for i in range(3):
+        client.post(
+            "/creatures/",
+            json={
+                "name": f"Beast {i}",
+                "mythology": "Greek" if i else "Norse",
+                "creature_type": "Test",
+                "danger_level": 5,
+            },
+        )
+
+    first = client.get("/creatures/", params={"limit": 2})
+    assert len(first.json()) == 2
+    rest = client.get(
+        "/creatures/", params={"after_id": first.headers["X-Next-Cursor"]}
+    )
+    assert [c["name"] for c in rest.json()] == ["Beast 2"]
+
+    greek = client.get("/creatures/", params={"mythology": "Greek"})
+    assert [c["name"] for c in greek.json()] == ["Beast 1", "Beast 2"]
+
+    counted = client.get(
+        "/creatures/", params={"mythology": "Greek", "limit": 1, "with_total": True}
+    )
+    assert counted.headers["X-Total-Count"] == "2"
+
+
+def test_async_class_rename_cascades(client: TestClient):
+    client.post(
+        "/creatures/",
+        json={
+            "name": "Member",
+            "mythology": "Test",
+            "creature_type": "Old",
+            "danger_level": 1,
+        },
+    )
+    class_id = client.get("/classes/").json()[0]["id"]
+
+    res = client.put(f"/classes/{class_id}", json={"name": "New"})
+    assert res.status_code == 200
+    assert res.json()["creatures_updated"] == 1
+    assert client.get("/creatures/").json()[0]["creature_type"] == "New"
+
+    assert client.delete(f"/classes/{class_id}").json() == {"ok": True}
+    assert client.delete(f"/classes/{class_id}").status_code == 404
+
+
+def test_sync_routes_still_reachable(client: TestClient):
+    # /creatures/export must not be captured by the async /{creature_id} route
+    res = client.get("/creatures/export")
+    assert res.status_code == 200
+
+
+def test_async_list_not_modified(client: TestClient):
+    etag = client.get("/classes/").headers["ETag"]
+    assert client.get("/classes/", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/classes/", json={"name": "Fresh"})
+    res = client.get("/classes/", headers={"If-None-Match": etag})
+    assert [c["name"] for c in res.json()] == ["Fresh"]
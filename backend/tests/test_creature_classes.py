@@ -1,11 +1,20 @@
+import threading
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine, select
 from sqlmodel.pool import StaticPool
 
 from app.app import app
 from app.db import get_session
-from app.models import Creature
+from app.services import versions
+from app.services.classes import (
+    DEFAULT_CLASSES,
+    insert_missing_classes,
+    registry,
+    seed_default_classes,
+)
+from app.models import Creature, CreatureClass, CreatureClassRead
 
 # Setup In-Memory Database
 engine = create_engine(
@@ -16,6 +25,8 @@ engine = create_engine(
 @pytest.fixture(name="session")
 def session_fixture():
     SQLModel.metadata.create_all(engine)
+    # Every test starts with an empty database
+    registry.invalidate()
     with Session(engine) as session:
         yield session
     SQLModel.metadata.drop_all(engine)
@@ -79,6 +90,37 @@ def test_update_class_rename_cascade(client: TestClient, session: Session):
     assert creature.creature_type == "New Name"
 
 
+def test_update_class_rename_reports_cascaded_rows(
+    client: TestClient, session: Session
+):
+    c_res = client.post(
+        "/classes/", json={"name": "Crowded", "color": "#000", "text_color": "#fff"}
+    )
+    class_id = c_res.json()["id"]
+    for i in range(3):
+        session.add(
+            Creature(
+                name=f"Member {i}",
+                creature_type="Crowded",
+                mythology="Test",
+                danger_level=1,
+            )
+        )
+    session.add(
+        Creature(
+            name="Outsider", creature_type="Other", mythology="Test", danger_level=1
+        )
+    )
+    session.commit()
+
+    res = client.put(f"/classes/{class_id}", json={"name": "Renamed"})
+    assert res.status_code == 200
+    assert res.json()["creatures_updated"] == 3
+
+    res = client.put(f"/classes/{class_id}", json={"color": "#111"})
+    assert res.json()["creatures_updated"] == 0
+
+
 def test_delete_class(client: TestClient):
     c_res = client.post(
         "/classes/", json={"name": "To Delete", "color": "#000", "text_color": "#fff"}
@@ -113,3 +155,231 @@ def test_create_class_missing_name(client: TestClient):
     payload = {"color": "#000", "text_color": "#fff"}
     response = client.post("/classes/", json=payload)
     assert response.status_code == 422
+
+
+# --- Class Registry ---
+
+
+@pytest.fixture(name="statements")
+def statements_fixture():
+    """Collect the SQL statements run on the test engine."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def test_list_classes_served_from_registry(client: TestClient, statements: list):
+    client.get("/classes/")  # load the registry, as the lifespan hook does
+    client.post("/classes/", json={"name": "Cached", "color": "#000"})
+    statements.clear()
+
+    response = client.get("/classes/")
+    assert [c["name"] for c in response.json()] == ["Cached"]
+    # Only the version marker is read; the rows come from memory
+    assert len(statements) == 1
+    assert "FROM tableversion" in statements[0]
+
+
+def test_create_creature_skips_class_lookup(client: TestClient, statements: list):
+    client.get("/classes/")
+    client.post("/classes/", json={"name": "Known"})
+    statements.clear()
+
+    client.post(
+        "/creatures/",
+        json={
+            "name": "Beast",
+            "mythology": "Test",
+            "creature_type": "Known",
+            "danger_level": 1,
+        },
+    )
+    assert not any("FROM creatureclass" in s for s in statements)
+    assert len(client.get("/classes/").json()) == 1
+
+
+def test_registry_tracks_renames_and_deletes(client: TestClient):
+    class_id = client.post("/classes/", json={"name": "Before"}).json()["id"]
+    client.put(f"/classes/{class_id}", json={"name": "After"})
+    assert [c["name"] for c in client.get("/classes/").json()] == ["After"]
+
+    client.delete(f"/classes/{class_id}")
+    assert client.get("/classes/").json() == []
+
+
+def test_registry_miss_falls_back_to_database(client: TestClient, session: Session):
+    client.get("/classes/")  # load the registry
+    # Registered behind the registry's back, e.g. by another worker
+    session.add(CreatureClass(name="External"))
+    session.commit()
+
+    client.post(
+        "/creatures/",
+        json={
+            "name": "Beast",
+            "mythology": "Test",
+            "creature_type": "External",
+            "danger_level": 1,
+        },
+    )
+    names = [c["name"] for c in client.get("/classes/").json()]
+    assert names == ["External"]
+
+
+def test_registry_hit_is_rechecked_after_a_foreign_delete(
+    client: TestClient, session: Session
+):
+    client.post("/classes/", json={"name": "Fae"})
+    assert client.get("/classes/").json()[0]["name"] == "Fae"
+    # Deleted by another worker: its registry, not this one, forgets it
+    session.delete(session.exec(select(CreatureClass)).one())
+    versions.bump(session, versions.CLASSES)
+    session.commit()
+
+    response = client.post(
+        "/creatures/",
+        json={
+            "name": "Pixie",
+            "mythology": "Celtic",
+            "creature_type": "Fae",
+            "danger_level": 1,
+        },
+    )
+    assert response.status_code == 200
+    assert [c.name for c in session.exec(select(CreatureClass))] == ["Fae"]
+
+
+def test_registry_snapshot_is_safe_under_concurrent_writes():
+    registry.replace([CreatureClass(id=i, name=f"C{i}") for i in range(200)], 1)
+    errors = []
+
+    def writer():
+        for i in range(200, 2000):
+            registry.put(CreatureClassRead(id=i, name=f"C{i}"))
+            if i % 300 == 0:
+                registry.discard(f"C{i - 1}")
+
+    def reader():
+        try:
+            for _ in range(500):
+                classes = registry.snapshot(1)
+                if classes is not None:
+                    assert [c.id for c in classes] == sorted(c.id for c in classes)
+        except Exception as exc:  # e.g. dict changed size during iteration
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer)] + [
+        threading.Thread(target=reader) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert registry.snapshot(2) is None  # another version: caller must reload
+    registry.invalidate()
+
+
+def test_writers_bump_versions_in_one_order(client: TestClient):
+    """Creating with a new class and renaming a populated class both touch
+    both version rows; locking them in different orders could deadlock."""
+    bumped = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE tableversion"):
+            bumped.append(next(p for p in parameters if isinstance(p, str)))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        client.post(
+            "/creatures/",
+            json={
+                "name": "Beast",
+                "mythology": "Test",
+                "creature_type": "Fresh",
+                "danger_level": 1,
+            },
+        )
+        orders = [list(bumped)]
+        bumped.clear()
+        class_id = client.get("/classes/").json()[0]["id"]
+        client.put(f"/classes/{class_id}", json={"name": "Renamed"})
+        orders.append(list(bumped))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    expected = sorted([versions.CREATURES, versions.CLASSES])
+    assert orders == [expected, expected]
+
+
+# --- Conditional GET ---
+
+
+def test_list_classes_not_modified_until_write(client: TestClient):
+    class_id = client.post("/classes/", json={"name": "Tagged"}).json()["id"]
+    etag = client.get("/classes/").headers["ETag"]
+    creatures_etag = client.get("/creatures/").headers["ETag"]
+
+    res = client.get("/classes/", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+
+    client.put(f"/classes/{class_id}", json={"name": "Retagged"})
+    res = client.get("/classes/", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()[0]["name"] == "Retagged"
+    # No creature was renamed, so their cached listing is still valid
+    res = client.get("/creatures/", headers={"If-None-Match": creatures_etag})
+    assert res.status_code == 304
+
+
+def test_rename_class_statement_budget(client: TestClient, sql_budget):
+    class_id = client.post("/classes/", json={"name": "Old"}).json()["id"]
+    for i in range(20):
+        client.post(
+            "/creatures/",
+            json={
+                "name": f"Beast {i}",
+                "mythology": "Test",
+                "creature_type": "Old",
+                "danger_level": 1,
+            },
+        )
+
+    # The cascade is one UPDATE however many creatures carry the class
+    with sql_budget(6):
+        res = client.put(f"/classes/{class_id}", json={"name": "New"})
+    assert res.status_code == 200
+
+
+# --- Default Class Seeding ---
+
+
+def test_seed_default_classes_is_one_idempotent_statement(
+    client: TestClient, session: Session, sql_budget
+):
+    client.post("/classes/", json={"name": "Fae", "text_color": "#000"})
+
+    added = seed_default_classes(session)
+    assert "Fae" not in added
+    assert len(added) == len(DEFAULT_CLASSES) - 1
+    assert versions.current(session, versions.CLASSES) == 2
+    # The registry picks up the new rows on its next load
+    assert len(client.get("/classes/").json()) == len(DEFAULT_CLASSES)
+
+    with sql_budget(1):
+        assert seed_default_classes(session) == []
+    assert versions.current(session, versions.CLASSES) == 2
+    # An existing class keeps its own style
+    fae = session.exec(select(CreatureClass).where(CreatureClass.name == "Fae")).one()
+    assert fae.text_color == "#000"
+
+
+def test_insert_missing_classes_skips_duplicates_in_one_call(session: Session):
+    added = insert_missing_classes(session, [{"name": "Twin"}, {"name": "Twin"}])
+    assert added == ["Twin"]
+    assert insert_missing_classes(session, []) == []
@@ -1,10 +1,15 @@
+import csv
+import io
+import json
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine, select
 from sqlmodel.pool import StaticPool
 
 from app.app import app
 from app.db import get_session
+from app.services.classes import registry
+from app.models import Creature, CreatureRead
 
 # 1. Setup In-Memory Database for Testing
 engine = create_engine(
@@ -15,6 +20,8 @@ engine = create_engine(
 @pytest.fixture(name="session")
 def session_fixture():
     SQLModel.metadata.create_all(engine)
+    # Every test starts with an empty database
+    registry.invalidate()
     with Session(engine) as session:
         yield session
     SQLModel.metadata.drop_all(engine)
@@ -216,3 +223,400 @@ def test_update_then_read_reflects_change(client: TestClient):
     res = client.get(f"/creatures/{cid}")
     assert res.status_code == 200
     assert res.json()["name"] == "V2"  # Should match V2
+
+
+# --- Pagination ---
+
+
+def _create_many(client: TestClient, count: int) -> list[int]:
+    ids = []
+    for i in range(count):
+        res = client.post(
+            "/creatures/",
+            json={
+                "name": f"Page Creature {i}",
+                "mythology": "Test",
+                "creature_type": "Test",
+                "danger_level": 1,
+            },
+        )
+        ids.append(res.json()["id"])
+    return ids
+
+
+def test_list_creatures_paginates_with_cursor(client: TestClient):
+    ids = _create_many(client, 5)
+
+    first = client.get("/creatures/", params={"limit": 2})
+    assert first.status_code == 200
+    assert [c["id"] for c in first.json()] == ids[:2]
+    cursor = first.headers["X-Next-Cursor"]
+    assert cursor == str(ids[1])
+
+    second = client.get("/creatures/", params={"limit": 2, "after_id": cursor})
+    assert [c["id"] for c in second.json()] == ids[2:4]
+
+    last = client.get(
+        "/creatures/", params={"limit": 2, "after_id": second.headers["X-Next-Cursor"]}
+    )
+    assert [c["id"] for c in last.json()] == ids[4:]
+    assert "X-Next-Cursor" not in last.headers
+
+
+def test_list_creatures_exact_page_has_no_cursor(client: TestClient):
+    _create_many(client, 2)
+
+    response = client.get("/creatures/", params={"limit": 2})
+    assert len(response.json()) == 2
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_list_creatures_total_count_is_opt_in(client: TestClient):
+    _create_many(client, 3)
+
+    plain = client.get("/creatures/", params={"limit": 1})
+    assert "X-Total-Count" not in plain.headers
+
+    counted = client.get("/creatures/", params={"limit": 1, "with_total": True})
+    assert counted.headers["X-Total-Count"] == "3"
+    assert len(counted.json()) == 1
+
+    filtered = client.get(
+        "/creatures/", params={"name": "Creature 2", "with_total": True}
+    )
+    assert filtered.headers["X-Total-Count"] == "1"
+
+
+def test_list_creatures_invalid_limit(client: TestClient):
+    response = client.get("/creatures/", params={"limit": 0})
+    assert response.status_code == 422
+
+
+# --- Filtering ---
+
+
+def _seed_filter_set(client: TestClient):
+    rows = [
+        ("Red Dragon", "Draconic", "Norse", "Mountains", 9),
+        ("Sea Serpent", "Abyssal", "Norse", "Ocean", 7),
+        ("Pixie", "Fae", "Celtic", "Forest", 2),
+        ("Wyvern", "Draconic", "Celtic", "Mountains", 6),
+    ]
+    for name, ctype, myth, habitat, danger in rows:
+        client.post(
+            "/creatures/",
+            json={
+                "name": name,
+                "creature_type": ctype,
+                "mythology": myth,
+                "habitat": habitat,
+                "danger_level": danger,
+            },
+        )
+
+
+def _names(response) -> list[str]:
+    assert response.status_code == 200
+    return sorted(c["name"] for c in response.json())
+
+
+def test_filter_by_name_substring(client: TestClient):
+    _seed_filter_set(client)
+    response = client.get("/creatures/", params={"name": "DRAG"})
+    assert _names(response) == ["Red Dragon"]
+
+
+def test_filter_by_multiple_values(client: TestClient):
+    _seed_filter_set(client)
+    response = client.get("/creatures/", params={"creature_type": ["Draconic", "Fae"]})
+    assert _names(response) == ["Pixie", "Red Dragon", "Wyvern"]
+
+
+def test_filter_combined_with_danger_range(client: TestClient):
+    _seed_filter_set(client)
+    response = client.get(
+        "/creatures/",
+        params={
+            "mythology": "Celtic",
+            "habitat": "Mountains",
+            "min_danger": 5,
+            "max_danger": 8,
+        },
+    )
+    assert _names(response) == ["Wyvern"]
+
+
+def test_filter_name_escapes_wildcards(client: TestClient):
+    _seed_filter_set(client)
+    response = client.get("/creatures/", params={"name": "%"})
+    assert _names(response) == []
+
+
+def test_filter_applies_before_pagination(client: TestClient):
+    _seed_filter_set(client)
+    first = client.get("/creatures/", params={"mythology": "Norse", "limit": 1})
+    assert _names(first) == ["Red Dragon"]
+    second = client.get(
+        "/creatures/",
+        params={
+            "mythology": "Norse",
+            "limit": 1,
+            "after_id": first.headers["X-Next-Cursor"],
+        },
+    )
+    assert _names(second) == ["Sea Serpent"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+# --- Stats ---
+
+
+def test_stats_aggregates_counts_and_facets(client: TestClient, session: Session):
+    _seed_filter_set(client)
+    # Stamped long ago / never: counted in totals but not as recent
+    session.add(
+        Creature(
+            name="Old Troll",
+            creature_type="Giant",
+            mythology="Norse",
+            habitat="Mountains",
+            danger_level=10,
+            last_modify="2001-01-01T00:00:00+00:00",
+        )
+    )
+    session.add(
+        Creature(
+            name="Mystery", creature_type="Fae", mythology="Celtic", danger_level=2
+        )
+    )
+    session.commit()
+
+    response = client.get("/creatures/stats")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["total"] == 6
+    assert stats["critical"] == 2
+    assert stats["added_last_24h"] == 4
+    assert stats["added_this_month"] == 4
+    assert stats["danger_levels"] == {"2": 2, "6": 1, "7": 1, "9": 1, "10": 1}
+    assert stats["creature_types"] == {
+        "Abyssal": 1,
+        "Draconic": 2,
+        "Fae": 2,
+        "Giant": 1,
+    }
+    assert stats["mythologies"] == {"Celtic": 3, "Norse": 3}
+    assert stats["habitats"] == {"Forest": 1, "Mountains": 3, "Ocean": 1, "Unknown": 1}
+
+
+def test_stats_on_empty_table(client: TestClient):
+    stats = client.get("/creatures/stats").json()
+    assert stats["total"] == 0
+    assert stats["critical"] == 0
+    assert stats["creature_types"] == {}
+
+
+# --- Bulk Import ---
+
+
+def _bulk_rows(count: int, creature_type: str = "Bulk Class") -> list[dict]:
+    return [
+        {
+            "name": f"Bulk {i}",
+            "mythology": "Test",
+            "creature_type": creature_type,
+            "danger_level": 3,
+        }
+        for i in range(count)
+    ]
+
+
+def test_bulk_import_json_array(client: TestClient):
+    rows = _bulk_rows(5) + _bulk_rows(2, creature_type="Second Class")
+    response = client.post("/creatures/bulk", params={"batch_size": 2}, json=rows)
+    assert response.status_code == 200
+    assert response.json() == {
+        "created": 7,
+        "classes_created": ["Bulk Class", "Second Class"],
+    }
+
+    creatures = client.get("/creatures/").json()
+    assert len(creatures) == 7
+    assert all("api.dicebear.com" in c["image_url"] for c in creatures)
+    assert all("T" in c["last_modify"] for c in creatures)
+    class_names = [c["name"] for c in client.get("/classes/").json()]
+    assert {"Bulk Class", "Second Class"} <= set(class_names)
+
+
+def test_bulk_import_ndjson_reuses_existing_class(client: TestClient):
+    client.post("/classes/", json={"name": "Bulk Class"})
+    body = "\n".join(json.dumps(row) for row in _bulk_rows(3)) + "\n"
+    response = client.post(
+        "/creatures/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"created": 3, "classes_created": []}
+    assert len(client.get("/classes/").json()) == 1
+
+
+def test_bulk_import_registers_classes_with_upsert(client: TestClient, sql_budget):
+    # No SELECT-then-INSERT window for a concurrent upload to collide in
+    with sql_budget(5) as profile:
+        res = client.post("/creatures/bulk", json=_bulk_rows(3, creature_type="Raced"))
+    assert res.json() == {"created": 3, "classes_created": ["Raced"]}
+    [class_insert] = [s for s, _ in profile.statements if "INTO creatureclass" in s]
+    assert "ON CONFLICT (name) DO NOTHING" in class_insert
+
+
+def test_bulk_import_rejects_invalid_line(client: TestClient):
+    rows = _bulk_rows(2)
+    rows[1]["danger_level"] = "High"
+    body = "\n".join(json.dumps(row) for row in rows)
+    response = client.post(
+        "/creatures/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][:2] == ["body", 1]
+    assert client.get("/creatures/").json() == []
+
+
+def test_bulk_import_rejects_invalid_json(client: TestClient):
+    response = client.post("/creatures/bulk", json=[{"name": "Incomplete"}])
+    assert response.status_code == 422
+
+
+# --- Export ---
+
+
+def test_export_ndjson_streams_every_row(client: TestClient):
+    client.post("/creatures/bulk", json=_bulk_rows(3))
+
+    response = client.get("/creatures/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert [json.loads(line)["name"] for line in lines] == [
+        "Bulk 0",
+        "Bulk 1",
+        "Bulk 2",
+    ]
+
+
+def test_export_csv_with_filter(client: TestClient):
+    _seed_filter_set(client)
+
+    response = client.get(
+        "/creatures/export", params={"format": "csv", "creature_type": "Draconic"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert sorted(row["name"] for row in rows) == ["Red Dragon", "Wyvern"]
+    assert set(rows[0]) == set(CreatureRead.model_fields)
+
+
+def test_export_empty_csv_has_header(client: TestClient):
+    response = client.get("/creatures/export", params={"format": "csv"})
+    assert response.text.strip() == ",".join(CreatureRead.model_fields)
+
+
+# --- Conditional GET ---
+
+
+def test_list_creatures_not_modified(client: TestClient):
+    client.post("/creatures/bulk", json=_bulk_rows(2))
+    first = client.get("/creatures/")
+    etag = first.headers["ETag"]
+
+    cached = client.get("/creatures/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    # A different page or filter is a different representation
+    other = client.get("/creatures/", params={"limit": 1})
+    assert other.headers["ETag"] != etag
+
+
+def test_write_changes_creatures_etag(client: TestClient):
+    client.post("/creatures/bulk", json=_bulk_rows(1))
+    etag = client.get("/creatures/").headers["ETag"]
+    creature_id = client.get("/creatures/").json()[0]["id"]
+    item_etag = client.get(f"/creatures/{creature_id}").headers["ETag"]
+
+    res = client.put(
+        f"/creatures/{creature_id}",
+        json={
+            "name": "Changed",
+            "mythology": "Test",
+            "creature_type": "Bulk Class",
+            "danger_level": 3,
+        },
+    )
+    assert res.status_code == 200
+
+    res = client.get("/creatures/", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()[0]["name"] == "Changed"
+    res = client.get(f"/creatures/{creature_id}", headers={"If-None-Match": item_etag})
+    assert res.status_code == 200
+
+
+# --- Statement Budgets ---
+
+
+def _creature_payload(name: str = "Budget Beast", creature_type: str = "Budget"):
+    return {
+        "name": name,
+        "mythology": "Test",
+        "creature_type": creature_type,
+        "danger_level": 4,
+    }
+
+
+def test_create_creature_statement_budget(client: TestClient, sql_budget):
+    client.get("/classes/")  # warm the class registry, as the lifespan hook does
+    # class version, class lookup, class + creature inserts and bumps, read
+    with sql_budget(7):
+        client.post("/creatures/", json=_creature_payload())
+    with sql_budget(4):  # known class: class version, insert, bump, read back
+        client.post("/creatures/", json=_creature_payload("Second"))
+
+
+def test_read_paths_statement_budget(client: TestClient, sql_budget):
+    client.post("/creatures/bulk", json=_bulk_rows(30))
+    creature_id = client.get("/creatures/").json()[0]["id"]
+
+    with sql_budget(2):  # version marker + row
+        client.get(f"/creatures/{creature_id}")
+    with sql_budget(2):  # version marker + page, however many rows
+        client.get("/creatures/", params={"limit": 30})
+    with sql_budget(3):
+        client.get("/creatures/", params={"limit": 30, "with_total": True})
+    with sql_budget(3):
+        client.get("/creatures/search", params={"q": "Bulk"})
+
+
+def test_bulk_import_statement_budget_is_flat(client: TestClient, sql_budget):
+    with sql_budget(5):
+        client.post("/creatures/bulk", json=_bulk_rows(5))
+    with sql_budget(5):
+        client.post("/creatures/bulk", json=_bulk_rows(200, creature_type="Other"))
+
+
+def test_sql_budget_flags_repeated_statements(session: Session, sql_budget):
+    session.add_all(Creature(**_creature_payload(f"N{i}")) for i in range(4))
+    session.commit()
+    ids = [c.id for c in session.exec(select(Creature))]
+    session.expunge_all()
+
+    with sql_budget(10, allow_repeats=True) as profile:
+        for creature_id in ids:
+            session.get(Creature, creature_id)
+    [(shape, count)] = profile.repeated().items()
+    assert count == 4
+    assert "FROM creature" in shape
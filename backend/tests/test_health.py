@@ -1,5 +1,7 @@
 from fastapi.testclient import TestClient
+from sqlmodel import create_engine
 from app.app import app
+from app.db import enable_sqlite_pragmas, pool_options, pool_status
 
 client = TestClient(app)
 
@@ -14,3 +16,30 @@ def test_openapi_accessible():
     """Verify that the OpenAPI JSON schema is reachable."""
     response = client.get("/openapi.json")
     assert response.status_code == 200
+
+
+def test_health_reports_pool_usage():
+    """Verify that /health exposes the connection pool counters."""
+    response = client.get("/health")
+    assert response.status_code == 200
+    pool = response.json()["database"]["sync"]
+    assert pool["pool"] == "QueuePool"
+    assert {"size", "checked_out", "idle", "overflow"} <= set(pool)
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    """Verify that new SQLite connections get WAL and a busy timeout."""
+    url = f"sqlite:///{tmp_path / 'pragmas.db'}"
+    engine = create_engine(url, **pool_options(url))
+    enable_sqlite_pragmas(engine)
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+    assert pool_status(engine)["checked_out"] == 0
+    engine.dispose()
+
+
+def test_in_memory_sqlite_skips_pool_sizing():
+    assert pool_options("sqlite://") == {}
+    assert pool_options("sqlite:///creatures.db")["pool_pre_ping"] is True
@@ -0,0 +1,85 @@
+import re
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+from app.app import app
+from app.db import get_session
+from app.metrics import instrument_engine, metrics
+from app.services.classes import registry
+
+# Setup In-Memory Database
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+instrument_engine(engine)
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    registry.invalidate()
+    metrics.reset()
+    with Session(engine) as session:
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+@pytest.fixture(name="client")
+def client_fixture(session: Session):
+    def get_session_override():
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    wanted = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    match = re.search(rf"^{name}\{{{re.escape(wanted)}\}} (\S+)$", text, re.M)
+    assert match, f"{name}{{{wanted}}} missing"
+    return float(match.group(1))
+
+
+def test_metrics_count_requests_per_route_template(client: TestClient):
+    created = client.post(
+        "/creatures/",
+        json={
+            "name": "Metric Beast",
+            "mythology": "Test",
+            "creature_type": "Test",
+            "danger_level": 3,
+        },
+    ).json()
+    client.get(f"/creatures/{created['id']}")
+    client.get(f"/creatures/{created['id']}")
+    client.get("/creatures/999999")
+    client.get("/no/such/path")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+
+    item = {"method": "GET", "route": "/creatures/{creature_id}"}
+    assert _sample(text, "http_requests_total", **item, status="200") == 2
+    assert _sample(text, "http_requests_total", **item, status="404") == 1
+    assert _sample(text, "http_request_duration_seconds_count", **item) == 3
+    assert _sample(text, "http_request_duration_seconds_bucket", **item, le="+Inf") == 3
+    assert (
+        _sample(
+            text, "http_requests_total", method="GET", route="<unmatched>", status="404"
+        )
+        == 1
+    )
+
+    # Each lookup reads the table version and the row
+    assert _sample(text, "db_statements_total", **item) >= 6
+    assert _sample(text, "db_statement_seconds_total", **item) > 0
+    assert _sample(text, "http_response_bytes_total", **item) > 0
+
+    post = {"method": "POST", "route": "/creatures/"}
+    assert _sample(text, "http_requests_total", **post, status="200") == 1
+    assert _sample(text, "db_statements_total", **post) > 0
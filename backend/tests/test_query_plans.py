@@ -0,0 +1,68 @@
+"""EXPLAIN QUERY PLAN checks: every dashboard filter must hit an index."""
+
+import pytest
+from sqlalchemy import update
+from sqlmodel import SQLModel, create_engine, select
+from sqlmodel.pool import StaticPool
+
+from app.models import Creature, CreatureFilter
+from app.services.creatures import apply_filters
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    SQLModel.metadata.create_all(engine)
+    yield
+    SQLModel.metadata.drop_all(engine)
+
+
+def query_plan(statement) -> list[str]:
+    sql = statement.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+    return [row[-1] for row in rows]
+
+
+def assert_uses_index(plan: list[str], index_name: str):
+    assert any(f"USING INDEX {index_name}" in step for step in plan), plan
+    assert not any(step.startswith("SCAN creature") for step in plan), plan
+
+
+@pytest.mark.parametrize(
+    "filters, index_name",
+    [
+        ({"creature_type": ["Draconic"]}, "ix_creature_creature_type_danger_level"),
+        (
+            {"creature_type": ["Draconic", "Fae"]},
+            "ix_creature_creature_type_danger_level",
+        ),
+        ({"mythology": ["Norse"]}, "ix_creature_mythology"),
+        ({"habitat": ["Ocean", "Forest"]}, "ix_creature_habitat"),
+        ({"min_danger": 4, "max_danger": 6}, "ix_creature_danger_level"),
+        (
+            {"creature_type": ["Draconic"], "min_danger": 4, "max_danger": 6},
+            "ix_creature_creature_type_danger_level",
+        ),
+    ],
+)
+def test_filter_query_uses_index(filters: dict, index_name: str):
+    # Same shape as a page request from GET /creatures/
+    statement = (
+        apply_filters(select(Creature), CreatureFilter(**filters))
+        .order_by(Creature.id)
+        .limit(101)
+    )
+    assert_uses_index(query_plan(statement), index_name)
+
+
+def test_class_rename_cascade_uses_index():
+    statement = (
+        update(Creature)
+        .where(Creature.creature_type == "Old Name")
+        .values(creature_type="New Name")
+    )
+    assert_uses_index(query_plan(statement), "ix_creature_creature_type_danger_level")
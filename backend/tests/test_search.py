@@ -0,0 +1,191 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+from app.app import app
+from app.db import get_session
+from app.models import SQLITE_SEARCH_TRIGGERS, Creature, create_search_index
+from app.services.classes import registry
+from app.services.search import RANK_WINDOW
+
+# Setup In-Memory Database
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    registry.invalidate()
+    with Session(engine) as session:
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+@pytest.fixture(name="client")
+def client_fixture(session: Session):
+    def get_session_override():
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _seed(client: TestClient):
+    rows = [
+        ("Dragon of the North", "Norse", "Mountains"),
+        ("Red Dragon", "Welsh", "Caves"),
+        ("Basilisk", "Greek", "Desert"),
+        ("Kraken", "Norse", "Ocean"),
+        ("Drake", "Germanic", "Dragonfell Hills"),
+    ]
+    for name, myth, habitat in rows:
+        client.post(
+            "/creatures/",
+            json={
+                "name": name,
+                "mythology": myth,
+                "habitat": habitat,
+                "creature_type": "Test",
+                "danger_level": 5,
+            },
+        )
+
+
+def _search(client: TestClient, q: str, **params) -> list[str]:
+    response = client.get("/creatures/search", params={"q": q, **params})
+    assert response.status_code == 200
+    return [c["name"] for c in response.json()]
+
+
+def test_search_ranks_prefix_then_name_matches(client: TestClient):
+    _seed(client)
+    # Prefix match first, then the other name hit, then the habitat hit
+    assert _search(client, "dragon") == [
+        "Dragon of the North",
+        "Red Dragon",
+        "Drake",
+    ]
+
+
+def test_search_finds_old_name_matches_past_the_window(
+    client: TestClient, session: Session
+):
+    rows = [("Basilisk", "Greek")] + [
+        (f"Grey Basilisk {i}", "Greek") for i in range(RANK_WINDOW + 100)
+    ]
+    session.exec(
+        insert(Creature),
+        params=[
+            {
+                "name": name,
+                "mythology": myth,
+                "creature_type": "Test",
+                "danger_level": 1,
+            }
+            for name, myth in rows
+        ],
+    )
+    session.commit()
+
+    # The exact match is the oldest row, behind a full window of newer hits
+    results = _search(client, "basilisk", limit=5)
+    assert results[0] == "Basilisk"
+    assert len(results) == 5
+    assert _search(client, "BASIL", limit=1) == ["Basilisk"]
+
+
+def test_search_filters_before_the_window(client: TestClient, session: Session):
+    rows = [("Old Greek Hydra", "Greek", 9)] + [
+        (f"Norse Hydra {i}", "Norse", 2) for i in range(RANK_WINDOW + 100)
+    ]
+    session.exec(
+        insert(Creature),
+        params=[
+            {
+                "name": name,
+                "mythology": myth,
+                "creature_type": "Test",
+                "danger_level": danger,
+            }
+            for name, myth, danger in rows
+        ],
+    )
+    session.commit()
+
+    # The only Greek hit is older than a full window of Norse ones
+    assert _search(client, "hydra", mythology="Greek") == ["Old Greek Hydra"]
+    assert _search(client, "hydra", min_danger=5) == ["Old Greek Hydra"]
+    assert _search(client, "ol", mythology="Greek") == ["Old Greek Hydra"]
+    assert _search(client, "old", mythology="Norse") == []
+    assert len(_search(client, "hydra", mythology=["Greek", "Norse"])) == 20
+
+
+def test_search_substring_across_columns(client: TestClient):
+    _seed(client)
+    assert sorted(_search(client, "rse")) == ["Dragon of the North", "Kraken"]
+    assert _search(client, "OCEAN") == ["Kraken"]
+
+
+def test_search_fuzzy_tolerates_typos(client: TestClient):
+    _seed(client)
+    assert _search(client, "basilsk")[0] == "Basilisk"
+    assert _search(client, "krakken")[0] == "Kraken"
+
+
+def test_search_short_query_uses_name_prefix(client: TestClient):
+    _seed(client)
+    assert _search(client, "dr") == ["Dragon of the North", "Drake"]
+
+
+def test_search_prefix_ending_in_the_last_code_point(client: TestClient):
+    _seed(client)
+    last = chr(0x10FFFF)
+    assert _search(client, last) == []
+    assert _search(client, "Dr" + last) == []
+    assert _search(client, "Kraken" + last)[0] == "Kraken"  # a typo, fuzzily
+
+
+def test_search_limit(client: TestClient):
+    _seed(client)
+    assert len(_search(client, "dragon", limit=1)) == 1
+
+
+def test_search_follows_updates_and_deletes(client: TestClient):
+    _seed(client)
+    kraken = client.get("/creatures/search", params={"q": "kraken"}).json()[0]
+    client.put(
+        f"/creatures/{kraken['id']}",
+        json={**kraken, "name": "Leviathan"},
+    )
+    assert "Kraken" not in _search(client, "kraken")
+    assert _search(client, "leviathan") == ["Leviathan"]
+
+    client.delete(f"/creatures/{kraken['id']}")
+    assert _search(client, "leviathan") == []
+
+
+def test_search_index_rebuilds_for_existing_rows(client: TestClient, session: Session):
+    # A database created before the search index existed
+    connection = session.connection()
+    for trigger in SQLITE_SEARCH_TRIGGERS:
+        connection.exec_driver_sql(f"DROP TRIGGER {trigger}")
+    connection.exec_driver_sql("DROP TABLE creature_search")
+    session.exec(
+        insert(Creature),
+        params=[
+            {
+                "name": "Griffin",
+                "mythology": "Greek",
+                "creature_type": "Test",
+                "danger_level": 4,
+            }
+        ],
+    )
+    create_search_index(connection)
+    session.commit()
+    assert _search(client, "griff") == ["Griffin"]
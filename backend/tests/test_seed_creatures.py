@@ -0,0 +1,111 @@
+import argparse
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, func, select, text
+from sqlmodel.pool import StaticPool
+
+from app.models import Creature, CreatureClass
+from app.services import versions
+from app.services.search import search_creatures
+from seed_creatures import generate, parse_weights, seed_creatures
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+def _rows(**options) -> list[tuple]:
+    return [row for batch in generate(**options) for row in batch]
+
+
+def test_generate_is_deterministic_per_seed():
+    def without_timestamps(rows):
+        return [row[:5] + row[6:] for row in rows]
+
+    first = _rows(count=200, seed=1, batch_size=64)
+    assert len(first) == 200
+    assert without_timestamps(first) == without_timestamps(
+        _rows(count=200, seed=1, batch_size=64)
+    )
+    assert without_timestamps(first) != without_timestamps(_rows(count=200, seed=2))
+
+
+def test_generate_follows_distributions():
+    rows = _rows(
+        count=500,
+        classes={"Draconic": 1},
+        mythologies={"Norse": 3, "Greek": 0},
+        dangers={10: 1},
+    )
+    assert {row[2] for row in rows} == {"Draconic"}
+    assert {row[1] for row in rows} == {"Norse"}
+    assert {row[3] for row in rows} == {10}
+    # Timestamps rise with the row number
+    assert [row[5] for row in rows] == sorted(row[5] for row in rows)
+
+
+def test_parse_weights():
+    assert parse_weights("Fae=2, Other") == {"Fae": 2.0, "Other": 1.0}
+    assert parse_weights("1=5,10=1", int) == {1: 5.0, 10: 1.0}
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_weights("Fae=-1")
+
+
+def test_seed_creatures_loads_rows_and_bumps_versions(session: Session):
+    written = seed_creatures(
+        engine,
+        300,
+        classes={"Draconic": 1, "Gremlin": 1},
+        batch_size=100,
+        progress=lambda _: None,
+    )
+    assert written == 300
+    assert session.exec(select(func.count()).select_from(Creature)).one() == 300
+
+    classes = {c.name: c for c in session.exec(select(CreatureClass))}
+    assert set(classes) == {"Draconic", "Gremlin"}
+    assert classes["Draconic"].text_color == "#ff6b6b"  # the seed_classes style
+    assert versions.current(session, versions.CREATURES) == 1
+    assert versions.current(session, versions.CLASSES) == 1
+
+    # The search index was rebuilt and its triggers restored
+    name = session.exec(select(Creature.name)).first()
+    assert any(c.name == name for c in search_creatures(session, name))
+    session.add(
+        Creature(
+            name="Zzyzx Oddity", mythology="Test", creature_type="Fae", danger_level=1
+        )
+    )
+    session.commit()
+    assert [c.name for c in search_creatures(session, "Zzyzx")] == ["Zzyzx Oddity"]
+
+
+def test_seed_creatures_replace(session: Session):
+    seed_creatures(engine, 50, progress=lambda _: None)
+    seed_creatures(engine, 20, replace=True, progress=lambda _: None)
+    assert session.exec(select(func.count()).select_from(Creature)).one() == 20
+
+
+def test_seed_creatures_restores_search_triggers_after_failure(session: Session):
+    def fail_midway(message: str):
+        if message.startswith("100/"):
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        seed_creatures(engine, 300, batch_size=100, progress=fail_midway)
+
+    triggers = session.exec(
+        text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    ).all()
+    assert len(triggers) == 3
+    # The batch that made it in was indexed by the rebuild
+    name = session.exec(select(Creature.name)).first()
+    assert any(c.name == name for c in search_creatures(session, name))
+    assert versions.current(session, versions.CREATURES) == 1
@@ -0,0 +1,89 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.pool import StaticPool
+
+from app.app import app
+from app.db import get_session
+from app.services.classes import registry
+
+# Setup In-Memory Database
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    registry.invalidate()
+    with Session(engine) as session:
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+@pytest.fixture(name="client")
+def client_fixture(session: Session):
+    def get_session_override():
+        return session
+
+    app.dependency_overrides[get_session] = get_session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_snapshot_returns_classes_and_first_page(client: TestClient):
+    client.post("/classes/", json={"name": "Draconic"})
+    for i in range(3):
+        client.post(
+            "/creatures/",
+            json={
+                "name": f"Beast {i}",
+                "mythology": "Test",
+                "creature_type": "Draconic",
+                "danger_level": 5,
+            },
+        )
+
+    response = client.get("/snapshot", params={"limit": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert [c["name"] for c in data["creatures"]] == ["Beast 0", "Beast 1"]
+    assert [c["name"] for c in data["classes"]] == ["Draconic"]
+    assert data["next_cursor"] == data["creatures"][-1]["id"]
+    assert data["total"] == 3
+    # The versions the dashboard would otherwise ask GET /version for
+    assert data["versions"] == client.get("/version").json()
+
+    # The cursor continues on the regular creatures endpoint
+    rest = client.get("/creatures/", params={"after_id": data["next_cursor"]})
+    assert [c["name"] for c in rest.json()] == ["Beast 2"]
+
+
+def test_snapshot_etag_follows_both_tables(client: TestClient):
+    first = client.get("/snapshot")
+    assert first.json() == {
+        "creatures": [],
+        "classes": [],
+        "next_cursor": None,
+        "total": 0,
+        "versions": {"creature": 0, "creatureclass": 0},
+    }
+    etag = first.headers["ETag"]
+
+    assert client.get("/snapshot", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/classes/", json={"name": "Fae"})
+    changed = client.get("/snapshot", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_version_moves_only_for_the_changed_table(client: TestClient):
+    before = client.get("/version").json()
+    assert set(before) == {"creature", "creatureclass"}
+
+    client.post("/classes/", json={"name": "Fae"})
+    after = client.get("/version").json()
+    assert after["creatureclass"] == before["creatureclass"] + 1
+    assert after["creature"] == before["creature"]
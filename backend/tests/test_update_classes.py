@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel.pool import StaticPool
+
+from app.models import Creature
+from app.services import versions
+from update_classes import NEW_CLASSES, class_for_id, update_creature_classes
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    SQLModel.metadata.drop_all(engine)
+
+
+def _seed(session: Session, count: int) -> None:
+    rows = [
+        {
+            "name": f"C{i}",
+            "mythology": "Test",
+            "creature_type": "Old",
+            "danger_level": 1,
+        }
+        for i in range(count)
+    ]
+    session.exec(insert(Creature), params=rows)
+    session.commit()
+
+
+def test_reclassifies_every_chunk_by_id_hash(session: Session):
+    _seed(session, 250)
+    messages = []
+
+    assert (
+        update_creature_classes(engine, chunk_size=100, progress=messages.append) == 250
+    )
+
+    types = dict(session.exec(select(Creature.id, Creature.creature_type)).all())
+    assert types == {i: class_for_id(i, NEW_CLASSES) for i in types}
+    assert set(types.values()) == set(NEW_CLASSES)
+    # One progress line and one version bump per chunk
+    assert len(messages) == 4
+    assert versions.current(session, versions.CREATURES) == 3
+
+
+def test_salt_changes_the_assignment(session: Session):
+    _seed(session, 50)
+    update_creature_classes(engine, salt=1, progress=lambda _: None)
+
+    types = dict(session.exec(select(Creature.id, Creature.creature_type)).all())
+    assert types == {i: class_for_id(i, NEW_CLASSES, salt=1) for i in types}
+    assert types != {i: class_for_id(i, NEW_CLASSES) for i in types}
+
+
+def test_empty_table(session: Session):
+    assert update_creature_classes(engine, progress=lambda _: None) == 0
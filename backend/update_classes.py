@@ -1,7 +1,22 @@
-import random
+"""Reassign every creature to one of NEW_CLASSES with chunked bulk UPDATEs.
+
+Each creature's class comes from a hash of its id, so a run is repeatable
+(change --salt for a different spread). The table is walked in id ranges,
+one short transaction per chunk, so memory stays flat and a live database
+is never locked for long. From the backend directory:
+    uv run python update_classes.py --chunk-size 20000 --pause 0.05
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from sqlalchemy import Engine, case, func, update
 from sqlmodel import Session, select
+
 from app.db import engine
 from app.models import Creature
+from app.services import versions
 
 NEW_CLASSES = [
     "Draconic",
@@ -13,25 +28,72 @@ NEW_CLASSES = [
     "Mythic Beasts",
 ]
 
+# Knuth's multiplicative hash; its high bits spread consecutive ids evenly
+HASH_MULTIPLIER = 2654435761
+
+
+def class_for_id(creature_id: int, classes: list[str], salt: int = 0) -> str:
+    """The class reclassify_statement assigns to creature_id, in Python."""
+    bucket = (creature_id + salt) * HASH_MULTIPLIER % 2**32 // 2**16
+    return classes[bucket % len(classes)]
 
-def update_creature_classes():
+
+def reclassify_statement(classes: list[str], first_id: int, end_id: int, salt: int = 0):
+    """UPDATE the creatures with first_id <= id < end_id to their hashed class."""
+    bucket = (Creature.id + salt) * HASH_MULTIPLIER % 2**32 // 2**16 % len(classes)
+    return (
+        update(Creature)
+        .where(Creature.id >= first_id, Creature.id < end_id)
+        .values(creature_type=case(dict(enumerate(classes)), value=bucket))
+    )
+
+
+def update_creature_classes(
+    engine: Engine = engine,
+    classes: list[str] = NEW_CLASSES,
+    chunk_size: int = 10_000,
+    salt: int = 0,
+    pause: float = 0.0,
+    progress: Callable[[str], None] = print,
+) -> int:
+    """Reclassify all creatures; returns the number of rows updated."""
     with Session(engine) as session:
-        statement = select(Creature)
-        creatures = session.exec(statement).all()
+        first_id, last_id = session.exec(
+            select(func.min(Creature.id), func.max(Creature.id))
+        ).one()
+    if first_id is None:
+        progress("No creatures to update.")
+        return 0
+
+    count = 0
+    for start in range(first_id, last_id + 1, chunk_size):
+        with Session(engine) as session:
+            count += session.exec(
+                reclassify_statement(classes, start, start + chunk_size, salt)
+            ).rowcount
+            # Per chunk, so cached pages never outlive the rows they show
+            versions.bump(session, versions.CREATURES)
+            session.commit()
+        progress(f"Updated {count} creatures (ids up to {start + chunk_size - 1})")
+        if pause:
+            time.sleep(pause)  # let other writers in on a live database
+
+    progress(f"Successfully updated {count} creatures to new classes.")
+    return count
 
-        count = 0
-        for creature in creatures:
-            # old_type = creature.creature_type # Unused
-            new_type = random.choice(NEW_CLASSES)
-            creature.creature_type = new_type
-            session.add(creature)
-            count += 1
-            # Optional: Log the change
-            # print(f"Updated {creature.name}: {old_type} -> {new_type}")
 
-        session.commit()
-        print(f"Successfully updated {count} creatures to new classes.")
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--salt", type=int, default=0, help="vary the assignment")
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="seconds to wait between chunks"
+    )
+    args = parser.parse_args()
+    update_creature_classes(
+        chunk_size=args.chunk_size, salt=args.salt, pause=args.pause
+    )
 
 
 if __name__ == "__main__":
-    update_creature_classes()
+    main()
@@ -1,61 +1,286 @@
 import requests
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Centralize API URL
 API_URL = os.getenv("API_URL", "http://localhost:8000")
 
+# (connect, read) timeout in seconds applied to every call, so a stuck
+# backend fails the rerun instead of hanging it
+TIMEOUT = (
+    float(os.getenv("API_CONNECT_TIMEOUT", "3.05")),
+    float(os.getenv("API_READ_TIMEOUT", "10")),
+)
 
-def get_creatures():
+
+def _make_session():
+    # Only idempotent calls are retried. DELETE is left out: a retry after a
+    # lost response would answer 404 for a delete that actually succeeded.
+    retry = Retry(
+        total=int(os.getenv("API_RETRIES", "3")),
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "PUT"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=int(os.getenv("API_POOL_SIZE", "10")),
+        max_retries=retry,
+    )
+    http = requests.Session()
+    http.mount("http://", adapter)
+    http.mount("https://", adapter)
+    return http
+
+
+# One keep-alive connection pool shared by every call and every Streamlit
+# session in this process
+session = _make_session()
+
+_stats_lock = threading.Lock()
+_stats = {"requests": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+
+
+def _record(elapsed, error):
+    with _stats_lock:
+        _stats["requests"] += 1
+        _stats["errors"] += int(error)
+        _stats["total_seconds"] += elapsed
+        _stats["max_seconds"] = max(_stats["max_seconds"], elapsed)
+
+
+def get_stats():
+    """Request count, error count and latency (ms) of calls made so far."""
+    with _stats_lock:
+        stats = dict(_stats)
+    count = stats["requests"]
+    return {
+        "requests": count,
+        "errors": stats["errors"],
+        "avg_ms": stats["total_seconds"] * 1000 / count if count else 0.0,
+        "max_ms": stats["max_seconds"] * 1000,
+    }
+
+
+def _request(method, path, **kwargs):
+    # Errors are connection failures, timeouts and 5xx answers
+    kwargs.setdefault("timeout", TIMEOUT)
+    start = time.perf_counter()
     try:
-        response = requests.get(f"{API_URL}/creatures/")
-        if response.status_code == 200:
-            return response.json()
-        return []
+        response = getattr(session, method)(f"{API_URL}{path}", **kwargs)
+    except requests.RequestException:
+        _record(time.perf_counter() - start, error=True)
+        raise
+    _record(time.perf_counter() - start, error=response.status_code >= 500)
+    return response
+
+
+# Largest page the backend serves for GET /creatures/
+PAGE_SIZE = 1000
+
+# Last body and ETag per URL; sent back as If-None-Match so an unchanged
+# resource costs a 304 with no body instead of a full download. Every
+# filter, page and search is its own URL, so only the most recently used
+# ETAG_CACHE_SIZE are kept.
+ETAG_CACHE_SIZE = int(os.getenv("API_ETAG_CACHE_SIZE", "64"))
+_etag_cache = OrderedDict()
+_etag_lock = threading.Lock()
+
+
+def _cache_get(key):
+    with _etag_lock:
+        cached = _etag_cache.get(key)
+        if cached:
+            _etag_cache.move_to_end(key)
+        return cached
+
+
+def _cache_put(key, entry):
+    with _etag_lock:
+        _etag_cache[key] = entry
+        _etag_cache.move_to_end(key)
+        while len(_etag_cache) > ETAG_CACHE_SIZE:
+            _etag_cache.popitem(last=False)
+
+
+# Response headers worth keeping next to a cached body
+_PAGE_HEADERS = ("X-Next-Cursor", "X-Total-Count")
+
+
+def _get(path, params=None):
+    """GET a JSON resource as (body, page headers).
+
+    Reuses the cached body on 304 Not Modified; body is None for any other
+    non-200 answer.
+    """
+    key = f"{path}?{urlencode(params or {}, doseq=True)}"
+    cached = _cache_get(key)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    response = _request("get", path, params=params, headers=headers)
+    if response.status_code == 304 and cached:
+        return cached[1], cached[2]
+    if response.status_code != 200:
+        return None, {}
+
+    body = response.json()
+    page_headers = {
+        name: response.headers[name]
+        for name in _PAGE_HEADERS
+        if name in response.headers
+    }
+    etag = response.headers.get("ETag")
+    if etag:
+        _cache_put(key, (etag, body, page_headers))
+    return body, page_headers
+
+
+def _get_json(path, params=None):
+    return _get(path, params)[0]
+
+
+def get_creatures(filters=None, after_id=None):
+    # Walk the keyset pages until a short page signals the end.
+    # `filters` maps query parameters (name, creature_type, mythology,
+    # habitat, min_danger, max_danger) that the backend applies in SQL.
+    creatures = []
+    try:
+        while True:
+            params = dict(filters or {}, limit=PAGE_SIZE)
+            if after_id is not None:
+                params["after_id"] = after_id
+            page = _get_json("/creatures/", params)
+            if page is None:
+                return creatures
+            creatures.extend(page)
+            if len(page) < PAGE_SIZE:
+                return creatures
+            after_id = page[-1]["id"]
     except Exception:
         return []
 
 
+def get_creature_page(filters=None, after_id=None, limit=50):
+    """One keyset page as (creatures, next cursor or None, total count)."""
+    params = dict(filters or {}, limit=limit, with_total=True)
+    if after_id is not None:
+        params["after_id"] = after_id
+    try:
+        page, headers = _get("/creatures/", params)
+    except Exception:
+        return [], None, 0
+    if page is None:
+        return [], None, 0
+    cursor = headers.get("X-Next-Cursor")
+    total = int(headers.get("X-Total-Count", len(page)))
+    return page, int(cursor) if cursor else None, total
+
+
 def get_classes():
     try:
-        response = requests.get(f"{API_URL}/classes/")
-        if response.status_code == 200:
-            return response.json()
-        return []
+        return _get_json("/classes/") or []
     except Exception:
         return []
 
 
+def search_creatures(query, limit=50, filters=None):
+    """Ranked matches from GET /creatures/search; [] when unavailable.
+
+    `filters` takes the same query parameters as get_creatures and is
+    applied before ranking.
+    """
+    try:
+        params = dict(filters or {}, q=query, limit=limit)
+        response = _request("get", "/creatures/search", params=params)
+    except requests.RequestException:
+        return []
+    return response.json() if response.status_code == 200 else []
+
+
+def get_creature_stats():
+    """Counts and filter facets from GET /creatures/stats, or None."""
+    try:
+        return _get_json("/creatures/stats")
+    except Exception:
+        return None
+
+
+def get_versions():
+    """Per-table change counters, e.g. {"creature": 12, "creatureclass": 3}."""
+    try:
+        return _get_json("/version")
+    except Exception:
+        return None
+
+
+def get_snapshot(limit=50):
+    """The dashboard's cold load as (snapshot, stats), in one round trip.
+
+    GET /snapshot (the first creatures page, its total, the classes and the
+    table versions) goes out together with GET /creatures/stats. Against a
+    backend without /snapshot the pieces are fetched concurrently instead;
+    snapshot has the same keys either way.
+    """
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        stats = pool.submit(get_creature_stats)
+        try:
+            snapshot = _get_json("/snapshot", {"limit": limit})
+        except Exception:
+            snapshot = None
+
+        if snapshot is None:
+            page = pool.submit(get_creature_page, None, None, limit)
+            classes = pool.submit(get_classes)
+            versions = pool.submit(get_versions)
+            creatures, next_cursor, total = page.result()
+            snapshot = {
+                "creatures": creatures,
+                "classes": classes.result(),
+                "next_cursor": next_cursor,
+                "total": total,
+                "versions": versions.result(),
+            }
+        return snapshot, stats.result()
+
+
 def create_creature(payload):
-    response = requests.post(f"{API_URL}/creatures/", json=payload)
+    response = _request("post", "/creatures/", json=payload)
     response.raise_for_status()
     return response.json()
 
 
 def update_creature(creature_id, payload):
-    response = requests.put(f"{API_URL}/creatures/{creature_id}", json=payload)
+    response = _request("put", f"/creatures/{creature_id}", json=payload)
     response.raise_for_status()
     return response.json()
 
 
 def delete_creature(creature_id):
-    response = requests.delete(f"{API_URL}/creatures/{creature_id}")
+    response = _request("delete", f"/creatures/{creature_id}")
     response.raise_for_status()
     return True
 
 
 def create_class(payload):
-    response = requests.post(f"{API_URL}/classes/", json=payload)
+    response = _request("post", "/classes/", json=payload)
     response.raise_for_status()
     return response.json()
 
 
 def update_class(class_id, payload):
-    response = requests.put(f"{API_URL}/classes/{class_id}", json=payload)
+    response = _request("put", f"/classes/{class_id}", json=payload)
     response.raise_for_status()
     return response.json()
 
 
 def delete_class(class_id):
-    response = requests.delete(f"{API_URL}/classes/{class_id}")
+    response = _request("delete", f"/classes/{class_id}")
     response.raise_for_status()
     return True
@@ -1,17 +1,382 @@
+import html
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 import streamlit as st
 import api_client
 
+CREATURES = "creature"
+CLASSES = "creatureclass"
 
-@st.cache_data(ttl=2, show_spinner=False)
-def get_creatures():
-    return api_client.get_creatures()
+# At most one GET /version per interval for the whole process, however many
+# dashboards are open; data is only refetched when a version moved
+VERSION_POLL_SECONDS = float(os.getenv("VERSION_POLL_SECONDS", "2"))
+MAX_FILTERED_RESULTS = 32
+# The recent-activity counts move with the clock, not only with writes
+STATS_MAX_AGE_SECONDS = 60
+
+
+class _Store:
+    """Process-wide cache of the classes, creature pages and stats.
+
+    Cached values are replaced, never mutated, so callers may hold on to
+    them. The lock only guards the cache itself: every HTTP call runs
+    outside it, so one slow response never stalls the other sessions.
+    Fetched data is swapped in only if no local write touched its table
+    meanwhile (epochs) and no newer version landed first.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.classes = None
+        self.classes_version = None  # the version the cached classes match
+        self.epochs = {CREATURES: 0, CLASSES: 0}  # bumped by local writes
+        self.filtered = {}  # filters / page -> result, at filtered_version
+        self.filtered_version = None
+        self.badges = {}  # class name -> badge HTML, built from badges_source
+        self.badges_source = None
+        self.stats = None  # GET /creatures/stats, taken at stats_version
+        self.stats_version = None
+        self.stats_at = 0.0
+        self.server = None  # last answer from GET /version
+        self.checked_at = 0.0
+        self.polling = False
+
+    def server_versions(self):
+        """The backend's table versions, polled at most every VERSION_POLL_SECONDS.
+
+        Sessions arriving while a poll is on the wire use the previous answer.
+        """
+        with self.lock:
+            now = time.monotonic()
+            due = self.server is None or now - self.checked_at >= VERSION_POLL_SECONDS
+            if not due or self.polling:
+                return self.server
+            self.polling = True
+        server = None
+        try:
+            server = api_client.get_versions()
+        finally:
+            with self.lock:
+                self.polling = False
+                self.server = server
+                self.checked_at = time.monotonic()
+        return server
+
+    # The methods below expect the caller to hold the lock
+
+    def install_classes(self, classes, server, epoch):
+        """Cache classes fetched at server's version unless they went stale."""
+        if self.epochs[CLASSES] != epoch:
+            return  # a local write since the fetch started; it may be missing
+        version = server.get(CLASSES) if server else None
+        current = self.classes_version
+        if version is not None and current is not None and version < current:
+            return  # a fetch of a newer version got here first
+        # Without a version (backend down) nothing is trusted next run
+        self.classes = classes
+        self.classes_version = version
+
+    def install_filtered(self, key, result, version, epoch):
+        """Cache a page or filtered list fetched at the creature version."""
+        if self.epochs[CREATURES] != epoch or version is None:
+            return
+        if version != self.filtered_version:
+            if self.filtered_version is not None and version < self.filtered_version:
+                return
+            self.filtered = {}
+            self.filtered_version = version
+        if len(self.filtered) >= MAX_FILTERED_RESULTS:
+            self.filtered.pop(next(iter(self.filtered)))
+        self.filtered[key] = result
+
+    def install_stats(self, stats, version, epoch):
+        if self.epochs[CREATURES] == epoch:
+            self.stats = stats
+            self.stats_version = version
+            self.stats_at = time.monotonic()
+
+    def advance(self, table):
+        # Our own write moved the table exactly one step. If someone else
+        # wrote too, the next version check sees a mismatch and refetches.
+        if table == CLASSES and self.classes_version is not None:
+            self.classes_version += 1
+        self.epochs[table] += 1
+        if table == CREATURES:
+            self.filtered = {}
+        self.checked_at = 0.0
+
+    def invalidate(self, table):
+        if table == CLASSES:
+            self.classes_version = None
+        self.epochs[table] += 1
+        if table == CREATURES:
+            self.filtered = {}
+
+
+@st.cache_resource(show_spinner=False)
+def _store():
+    return _Store()
+
+
+def _page_key(filters, after_id, limit):
+    return json.dumps(["page", filters or {}, after_id, limit], sort_keys=True)
+
+
+def preload(limit):
+    """Fill a cold cache for the dashboard's first view in one round trip.
+
+    The first page (unfiltered, `limit` rows), the classes, the stats and
+    the versions all come from GET /snapshot plus a concurrent GET
+    /creatures/stats. Once anything is cached this does nothing, and the
+    getters below only refetch what a version change made stale.
+    """
+    store = _store()
+    with store.lock:
+        if store.server is not None:
+            return
+        epochs = dict(store.epochs)
+
+    snapshot, stats = api_client.get_snapshot(limit)
+    server = snapshot["versions"]
+    version = server.get(CREATURES) if server else None
+    page = (snapshot["creatures"], snapshot["next_cursor"], snapshot["total"])
+    with store.lock:
+        if server is not None and store.server is None:
+            # Spares the first getter its own GET /version
+            store.server = server
+            store.checked_at = time.monotonic()
+        store.install_classes(snapshot["classes"], server, epochs[CLASSES])
+        key = _page_key(None, None, limit)
+        store.install_filtered(key, page, version, epochs[CREATURES])
+        if stats is not None:
+            store.install_stats(stats, version, epochs[CREATURES])
+
+
+def _refresh_classes(store):
+    """The classes, refetched only when their version moved."""
+    # Read the version before the data: if a write lands in between, the
+    # data is newer than its version and only costs one extra refetch
+    server = store.server_versions()
+    with store.lock:
+        version = server.get(CLASSES) if server else None
+        if (
+            store.classes is not None
+            and version is not None
+            and version == store.classes_version
+        ):
+            return store.classes
+        epoch = store.epochs[CLASSES]
+
+    classes = api_client.get_classes()
+    with store.lock:
+        store.install_classes(classes, server, epoch)
+        # A rejected fetch is still this run's best answer if nothing is cached
+        return store.classes if store.classes is not None else classes
+
+
+def _filtered(store, key, fetch):
+    # Filtered lists and pages only follow the creature version
+    server = store.server_versions()
+    version = server.get(CREATURES) if server else None
+    with store.lock:
+        if version is not None and version == store.filtered_version:
+            if key in store.filtered:
+                return store.filtered[key]
+        epoch = store.epochs[CREATURES]
+
+    result = fetch()
+    with store.lock:
+        store.install_filtered(key, result, version, epoch)
+    return result
+
+
+def get_creature_page(filters=None, after_id=None, limit=50):
+    """(creatures, next cursor, total) for one table page."""
+    return _filtered(
+        _store(),
+        _page_key(filters, after_id, limit),
+        lambda: api_client.get_creature_page(filters, after_id, limit),
+    )
 
 
-@st.cache_data(ttl=2, show_spinner=False)
 def get_classes():
-    return api_client.get_classes()
+    return _refresh_classes(_store())
+
+
+# Matches the backend's style for classes registered on the fly
+DEFAULT_BADGE_STYLE = {
+    "color": "rgba(127,19,236,0.1)",
+    "border_color": "rgba(127,19,236,0.2)",
+    "text_color": "#ad92c9",
+}
+
+
+def badge_html(name, style=None):
+    style = {k: (style or {}).get(k) or v for k, v in DEFAULT_BADGE_STYLE.items()}
+    return (
+        f'<span class="badge" style="background:{style["color"]}; '
+        f'color:{style["text_color"]}; border-color:{style["border_color"]};">'
+        f"{html.escape(name)}</span>"
+    )
+
+
+def get_class_badges():
+    """Class name -> prerendered badge HTML.
+
+    Rebuilt only when the cached class list is replaced, so each table row
+    costs a dict lookup instead of a scan over every class.
+    """
+    store = _store()
+    classes = _refresh_classes(store)
+    with store.lock:
+        if store.badges_source is not classes:
+            store.badges = {c["name"]: badge_html(c["name"], c) for c in classes or []}
+            store.badges_source = classes
+        return store.badges
+
+
+def get_creature_stats():
+    store = _store()
+    server = store.server_versions()
+    version = server.get(CREATURES) if server else None
+    with store.lock:
+        age = time.monotonic() - store.stats_at
+        if (
+            store.stats is not None
+            and store.stats_version == version
+            and age < STATS_MAX_AGE_SECONDS
+        ):
+            return store.stats
+        epoch = store.epochs[CREATURES]
+
+    stats = api_client.get_creature_stats()
+    with store.lock:
+        store.install_stats(stats, version, epoch)
+    return stats
 
 
 def clear_cache():
-    get_creatures.clear()
-    get_classes.clear()
+    store = _store()
+    with store.lock:
+        store.classes = store.stats = None
+        store.invalidate(CREATURES)
+        store.invalidate(CLASSES)
+
+
+# --- Type-ahead search ---
+
+SEARCH_LIMIT = int(os.getenv("SEARCH_LIMIT", "50"))
+_search_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="search")
+
+
+class SearchRequest:
+    """The latest search of one session; superseded queries are abandoned.
+
+    A query still queued is cancelled outright. One already on the wire
+    finishes in the background (bounded by the client timeout) and its
+    result is dropped. The same query is answered again only while no
+    creature changed, here or on the backend.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.future = None
+
+    def submit(self, query, filters=None, limit=SEARCH_LIMIT):
+        store = _store()
+        server = store.server_versions()
+        with store.lock:
+            epoch = store.epochs[CREATURES]
+        version = server.get(CREATURES) if server else None
+        key = json.dumps([query, filters or {}, limit, version, epoch], sort_keys=True)
+        if key != self.key or self.future is None:
+            if self.future is not None:
+                self.future.cancel()
+            self.key = key
+            self.future = _search_pool.submit(
+                api_client.search_creatures, query, limit, filters
+            )
+        return self.future
+
+    def result(self, on_wait=None):
+        # Wait in short slices; on_wait renders something, which is where
+        # Streamlit stops this run once a newer keystroke asked for a rerun
+        future = self.future
+        while not wait([future], timeout=0.1).done:
+            if on_wait:
+                on_wait()
+        return future.result()
+
+
+# --- Mutations: patch the cached classes from the API response; creature
+# writes drop the cached pages, which are refetched on the next view ---
+
+
+def _replace(items, item):
+    return [item if i["id"] == item["id"] else i for i in items]
+
+
+def create_creature(payload):
+    created = api_client.create_creature(payload)
+    store = _store()
+    with store.lock:
+        store.advance(CREATURES)
+        # A new creature type also registers a class on the backend
+        if store.classes is not None and created["creature_type"] not in {
+            c["name"] for c in store.classes
+        }:
+            store.invalidate(CLASSES)
+    return created
+
+
+def update_creature(creature_id, payload):
+    updated = api_client.update_creature(creature_id, payload)
+    store = _store()
+    with store.lock:
+        store.advance(CREATURES)
+    return updated
+
+
+def delete_creature(creature_id):
+    api_client.delete_creature(creature_id)
+    store = _store()
+    with store.lock:
+        store.advance(CREATURES)
+    return True
+
+
+def create_class(payload):
+    created = api_client.create_class(payload)
+    store = _store()
+    with store.lock:
+        if store.classes is not None:
+            store.classes = store.classes + [created]
+        store.advance(CLASSES)
+    return created
+
+
+def update_class(class_id, payload):
+    updated = api_client.update_class(class_id, payload)
+    renamed = updated.pop("creatures_updated", 0)
+    store = _store()
+    with store.lock:
+        if store.classes is not None:
+            store.classes = _replace(store.classes, updated)
+        store.advance(CLASSES)
+        # The rename cascaded to creatures on the backend; refetch those
+        if renamed:
+            store.invalidate(CREATURES)
+    return updated
+
+
+def delete_class(class_id):
+    api_client.delete_class(class_id)
+    store = _store()
+    with store.lock:
+        if store.classes is not None:
+            store.classes = [c for c in store.classes if c["id"] != class_id]
+        store.advance(CLASSES)
+    return True
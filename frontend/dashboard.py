@@ -1,5 +1,6 @@
 import streamlit as st
 import datetime
+import json
 import realm_map
 import sidebar
 import settings
@@ -7,7 +8,11 @@ from st_keyup import st_keyup
 import streamlit.components.v1 as components
 import os
 import api_utils
-import api_client
+
+# Typing pause (ms) before a search query is sent
+SEARCH_DEBOUNCE_MS = int(os.getenv("SEARCH_DEBOUNCE_MS", "300"))
+PAGE_SIZES = [25, 50, 100, 200]
+DEFAULT_PAGE_SIZE = 50
 
 
 # --- Flash Message Check ---
@@ -24,20 +29,25 @@ st.set_page_config(
 )
 
 
-def load_css():
-    # Inject Fonts (Material Symbols etc.)
-    st.markdown(
-        """
+FONTS_HTML = """
         <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&display=swap" rel="stylesheet">
         <link href="https://fonts.googleapis.com/css2?family=Noto+Sans:wght@400;500;600;700&display=swap" rel="stylesheet">
         <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Material+Symbols+Outlined:opsz,wght,FILL,GRAD@20..48,100..700,0..1,-50..200" />
-    """,
-        unsafe_allow_html=True,
-    )
+    """
+
 
+@st.cache_resource(show_spinner=False)
+def _style_html():
+    # Read once per process; every rerun still injects it into the page
     css_path = os.path.join(os.path.dirname(__file__), "style.css")
     with open(css_path) as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+        return f"<style>{f.read()}</style>"
+
+
+def load_css():
+    # Inject Fonts (Material Symbols etc.)
+    st.markdown(FONTS_HTML, unsafe_allow_html=True)
+    st.markdown(_style_html(), unsafe_allow_html=True)
 
 
 load_css()
@@ -71,18 +81,13 @@ def format_time_ago(iso_str):
         return iso_str
 
 
-def get_creatures():
-    return api_utils.get_creatures()
-
-
 def get_classes():
     return api_utils.get_classes()
 
 
 def delete_creature(id):
     try:
-        api_client.delete_creature(id)
-        api_utils.clear_cache()
+        api_utils.delete_creature(id)
         return True
     except Exception as e:
         st.error(f"Error: {e}")
@@ -91,8 +96,7 @@ def delete_creature(id):
 
 def update_creature(id, payload):
     try:
-        api_client.update_creature(id, payload)
-        api_utils.clear_cache()
+        api_utils.update_creature(id, payload)
     except Exception as e:
         st.error(f"Error: {e}")
 
@@ -187,8 +191,7 @@ def summon_dialog():
                 # last_modify auto-set by backend
             }
             try:
-                api_client.create_creature(payload)
-                api_utils.clear_cache()
+                api_utils.create_creature(payload)
                 st.session_state["toast_msg"] = ("Entity Summoned Successfully! 🐉", "✅")
                 st.rerun()
             except Exception as e:
@@ -225,8 +228,7 @@ def edit_dialog(c):
             # last_modify auto-updated by backend
         }
         update_creature(c["id"], payload)
-        # update_creature calls api_utils.clear_cache() now so we don't need to add it here explicitly if we modify update_creature
-        # update_creature calls api_utils.clear_cache() now so we don't need to add it here explicitly if we modify update_creature
+        # update_creature updates the cached list from the API response
         st.session_state["toast_msg"] = (f"{name} updated successfully!", "✅")
         st.rerun()
 
@@ -280,37 +282,15 @@ with col_b:
 
 st.write("")
 
-# Metrics Logic
-creatures = get_creatures()
-total = len(creatures)
-critical = sum(1 for c in creatures if c["danger_level"] >= 9)
-
-# Calculate monthly activity
-now = datetime.datetime.now(datetime.timezone.utc)
-start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-month_name = start_of_month.strftime("%B")
+# A cold cache gets the stats, classes and first page in one round trip
+api_utils.preload(DEFAULT_PAGE_SIZE)
 
-added_this_month = 0
-added_last_24h = 0
-one_day_ago = now - datetime.timedelta(days=1)
-
-for c in creatures:
-    try:
-        lm = c.get("last_modify")
-        if lm and lm != "Unknown":
-            dt = datetime.datetime.fromisoformat(str(lm))
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=datetime.timezone.utc)
-
-            # Monthly Check
-            if dt >= start_of_month:
-                added_this_month += 1
-
-            # 24h Check
-            if dt >= one_day_ago:
-                added_last_24h += 1
-    except Exception:
-        pass
+# Metrics Logic (aggregated by the backend, no row download needed)
+stats = api_utils.get_creature_stats() or {}
+total = stats.get("total", 0)
+critical = stats.get("critical", 0)
+added_this_month = stats.get("added_this_month", 0)
+added_last_24h = stats.get("added_last_24h", 0)
 
 # Metrics UI
 m1, m2, m3 = st.columns(3)
@@ -461,20 +441,22 @@ with s_col:
         height=0,
     )
 
+    # Reruns only after a pause in typing, not on every keystroke
     search_q = st_keyup(
         "Search",
-        placeholder="Search creatures by name...",
+        placeholder="Search creatures by name, mythology or habitat...",
         label_visibility="collapsed",
+        debounce=SEARCH_DEBOUNCE_MS,
     )
 with f_col:
     # Advanced Filters Popover
     with st.popover("Filter Options", use_container_width=True):
         st.markdown("### Filter Entities")
 
-        # 1. Extract Unique Values
-        all_types = sorted(list({c["creature_type"] for c in creatures}))
-        all_myths = sorted(list({c["mythology"] for c in creatures}))
-        all_habitats = sorted(list({c.get("habitat", "Unknown") for c in creatures}))
+        # 1. Unique Values (facets from the stats endpoint)
+        all_types = sorted(stats.get("creature_types", {}))
+        all_myths = sorted(stats.get("mythologies", {}))
+        all_habitats = sorted(stats.get("habitats", {}))
 
         # 2. Controls
         sel_types = st.multiselect("Class", all_types)
@@ -482,24 +464,76 @@ with f_col:
         sel_habitats = st.multiselect("Habitat", all_habitats)
         sel_danger = st.slider("Danger Level", 1, 10, (1, 10))
 
-# Apply Filters
-filtered = creatures
-
-# Initial Search Filter
-if search_q:
-    filtered = [c for c in filtered if search_q.lower() in c["name"].lower()]
-
-# Advanced Filters
+# Apply Filters (server-side, only the matching rows are fetched)
+min_d, max_d = sel_danger
+filters = {}
 if sel_types:
-    filtered = [c for c in filtered if c["creature_type"] in sel_types]
+    filters["creature_type"] = sel_types
 if sel_myths:
-    filtered = [c for c in filtered if c["mythology"] in sel_myths]
+    filters["mythology"] = sel_myths
 if sel_habitats:
-    filtered = [c for c in filtered if c.get("habitat", "Unknown") in sel_habitats]
+    filters["habitat"] = sel_habitats
+if (min_d, max_d) != (1, 10):
+    filters["min_danger"] = min_d
+    filters["max_danger"] = max_d
+
+# --- Paging ---
+# Only the visible page is fetched and built, so a rerun costs the same
+# however large the registry grows. Browsing walks the backend's keyset
+# cursors (a stack in session_state allows going back); search hits are
+# already limited and are paged locally by offset.
+p_info, p_size, p_prev, p_next = st.columns([5, 1.2, 0.5, 0.5])
+with p_size:
+    page_size = st.selectbox(
+        "Rows per page",
+        PAGE_SIZES,
+        index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE),
+        label_visibility="collapsed",
+        format_func=lambda n: f"{n} / page",
+    )
 
-# Danger Range
-min_d, max_d = sel_danger
-filtered = [c for c in filtered if min_d <= c["danger_level"] <= max_d]
+query = (search_q or "").strip()
+view = json.dumps([query, filters, page_size], sort_keys=True)
+if st.session_state.get("page_view") != view:
+    # New query, filters or page size: back to the first page
+    st.session_state["page_view"] = view
+    st.session_state["page_cursors"] = [None]
+cursors = st.session_state["page_cursors"]
+
+if query:
+    # Ranked top hits among the creatures passing the facet filters
+    search = st.session_state.setdefault("search", api_utils.SearchRequest())
+    search.submit(query, filters)
+    searching = st.empty()
+    hits = search.result(on_wait=lambda: searching.caption("Searching…"))
+    searching.empty()
+    offset = cursors[-1] or 0
+    filtered = hits[offset : offset + page_size]
+    next_cursor = offset + page_size if offset + page_size < len(hits) else None
+    total = len(hits)
+else:
+    filtered, next_cursor, total = api_utils.get_creature_page(
+        filters, cursors[-1], page_size
+    )
+
+first_row = (len(cursors) - 1) * page_size + 1
+with p_info:
+    if filtered:
+        last_row = first_row + len(filtered) - 1
+        # Search stops at SEARCH_LIMIT hits; there may be more matches
+        more = "+" if query and total >= api_utils.SEARCH_LIMIT else ""
+        st.caption(f"Showing {first_row:,}–{last_row:,} of {total:,}{more}")
+    else:
+        st.caption("No creatures match.")
+on_first_page = len(cursors) == 1
+with p_prev:
+    if st.button("‹", key="page_prev", help="Previous page", disabled=on_first_page):
+        cursors.pop()
+        st.rerun()
+with p_next:
+    if st.button("›", key="page_next", help="Next page", disabled=next_cursor is None):
+        cursors.append(next_cursor)
+        st.rerun()
 
 # --- Table ---
 st.markdown('<div class="table-container">', unsafe_allow_html=True)
@@ -530,6 +564,7 @@ with st.container():
     st.markdown("</div>", unsafe_allow_html=True)
 
 # Data Rows
+class_badges = api_utils.get_class_badges()
 for c in filtered:
     st.markdown('<div class="table-row">', unsafe_allow_html=True)
 
@@ -551,28 +586,11 @@ for c in filtered:
             unsafe_allow_html=True,
         )
 
-    # 2. Class
+    # 2. Class (unknown classes get the default style)
     with c2:
         ctype = c["creature_type"]
-        # Dynamic Color Lookup
-        classes_data = get_classes()  # Cached
-
-        # Default
-        bg, text, border = "rgba(127,19,236,0.1)", "#ad92c9", "rgba(127,19,236,0.2)"
-
-        # Find matching class
-        match = next((x for x in classes_data if x["name"] == ctype), None)
-        if match:
-            bg, text, border = (
-                match["color"],
-                match["text_color"],
-                match["border_color"],
-            )
-
-        st.markdown(
-            f'<span class="badge" style="background:{bg}; color:{text}; border-color:{border};">{ctype}</span>',
-            unsafe_allow_html=True,
-        )
+        badge = class_badges.get(ctype) or api_utils.badge_html(ctype)
+        st.markdown(badge, unsafe_allow_html=True)
 
     # 3. Myth
     with c3:
@@ -1,6 +1,46 @@
+import io
+import os
+
 import streamlit as st
+from PIL import Image
+
+MAP_PATH = os.path.join(os.path.dirname(__file__), "pictures/creatureMap.jpg")
+# Width of the overview sent to browsers; zoomed views send one tile
+MAP_MAX_WIDTH = int(os.getenv("MAP_MAX_WIDTH", "800"))
+ZOOM_LEVELS = {"Full map": 1, "2×": 2, "4×": 4}
+
+
+@st.cache_resource(show_spinner=False)
+def _source():
+    # Decoded once per process, not on every visit
+    with Image.open(MAP_PATH) as img:
+        return img.convert("RGB")
 
-import os
+
+@st.cache_resource(show_spinner=False)
+def map_tile(zoom=1, row=0, col=0, max_width=MAP_MAX_WIDTH):
+    """One tile of a zoom x zoom grid over the map, as a progressive JPEG.
+
+    Tiles are cut from the original, so zooming in shows full detail while
+    each view still sends at most max_width pixels across.
+    """
+    source = _source()
+    width, height = source.size
+    box = (
+        col * width // zoom,
+        row * height // zoom,
+        (col + 1) * width // zoom,
+        (row + 1) * height // zoom,
+    )
+    tile = source.crop(box)
+    if tile.width > max_width:
+        size = (max_width, round(tile.height * max_width / tile.width))
+        tile = tile.resize(size, Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    # Progressive: the browser paints a coarse full image first, then refines
+    tile.save(buffer, "JPEG", quality=80, optimize=True, progressive=True)
+    return buffer.getvalue()
 
 
 def show_map():
@@ -15,8 +55,18 @@ def show_map():
 
     st.write("")
 
+    zoom = ZOOM_LEVELS[
+        st.radio("Zoom", list(ZOOM_LEVELS), horizontal=True, key="map_zoom")
+    ]
+    row = col = 0
+    if zoom > 1:
+        c1, c2 = st.columns(2)
+        with c1:
+            col = st.slider("West ↔ East", 0, zoom - 1, 0, key=f"map_col_{zoom}")
+        with c2:
+            row = st.slider("North ↕ South", 0, zoom - 1, 0, key=f"map_row_{zoom}")
+
     try:
-        img_path = os.path.join(os.path.dirname(__file__), "pictures/creatureMap.jpg")
-        st.image(img_path, use_container_width=True)
+        st.image(map_tile(zoom, row, col), use_container_width=True)
     except Exception as e:
         st.error(f"Map image not found: {e}")
@@ -31,8 +31,7 @@ def edit_class_dialog(c):
             "text_color": e_color,
         }
         try:
-            api_client.update_class(c["id"], payload)
-            api_utils.clear_cache()
+            api_utils.update_class(c["id"], payload)
             st.session_state["toast_msg"] = ("Class Updated!", "✅")
             st.rerun()
         except Exception as e:
@@ -53,8 +52,7 @@ def delete_class_dialog(c):
     with col2:
         if st.button("Yes, Delete", type="primary", use_container_width=True):
             try:
-                api_client.delete_class(c["id"])
-                api_utils.clear_cache()
+                api_utils.delete_class(c["id"])
                 st.session_state["toast_msg"] = ("Class Deleted!", "🗑️")
                 st.rerun()
             except Exception as e:
@@ -102,8 +100,7 @@ def render_settings():
                         }
 
                         try:
-                            api_client.create_class(payload)
-                            api_utils.clear_cache()
+                            api_utils.create_class(payload)
                             st.session_state["toast_msg"] = (f"Class '{new_name}' added!", "✨")
                             st.rerun()
                         except Exception as e:
@@ -118,7 +115,7 @@ def render_settings():
                     with c1:
                         # Preview Badge
                         st.markdown(
-                            f'<span class="badge" style="background:{c["color"]}; color:{c["text_color"]}; border-color:{c["border_color"]};">{c["name"]}</span>',
+                            api_utils.badge_html(c["name"], c),
                             unsafe_allow_html=True,
                         )
 
@@ -138,3 +135,13 @@ def render_settings():
                                 "✖", key=f"del_{c['id']}", help=f"Delete {c['name']}"
                             ):
                                 delete_class_dialog(c)
+
+    with tab2:
+        st.markdown("### Backend Connection")
+        st.caption(f"API: {api_client.API_URL}")
+        stats = api_client.get_stats()
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Requests", stats["requests"])
+        m2.metric("Errors", stats["errors"])
+        m3.metric("Avg Latency", f"{stats['avg_ms']:.0f} ms")
+        m4.metric("Max Latency", f"{stats['max_ms']:.0f} ms")
@@ -0,0 +1,163 @@
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("streamlit")
+
+import api_client  # noqa: E402
+import api_utils  # noqa: E402
+from api_utils import CLASSES, CREATURES, _Store  # noqa: E402
+
+
+def _versions(creatures=1, classes=1):
+    return {CREATURES: creatures, CLASSES: classes}
+
+
+def test_classes_are_fetched_without_holding_the_lock():
+    store = _Store()
+
+    def fetch():
+        assert not store.lock.locked()
+        return [{"id": 1, "name": "Fae"}]
+
+    with (
+        patch.object(api_client, "get_versions", return_value=_versions()),
+        patch.object(api_client, "get_classes", side_effect=fetch),
+    ):
+        assert api_utils._refresh_classes(store) == [{"id": 1, "name": "Fae"}]
+
+    assert store.classes_version == 1
+
+
+def test_classes_keep_a_local_write_made_during_the_fetch():
+    store = _Store()
+    store.classes = [{"id": 1, "name": "Fae"}]
+    store.classes_version = 1
+
+    def fetch():
+        # Another session creates a class while this fetch is on the wire
+        with store.lock:
+            store.classes = store.classes + [{"id": 3, "name": "Titanic"}]
+            store.advance(CLASSES)
+        return [{"id": 1, "name": "Fae"}, {"id": 2, "name": "Abyssal"}]
+
+    with (
+        patch.object(api_client, "get_versions", return_value=_versions(classes=2)),
+        patch.object(api_client, "get_classes", side_effect=fetch),
+    ):
+        classes = api_utils._refresh_classes(store)
+
+    assert [c["name"] for c in classes] == ["Fae", "Titanic"]
+    assert store.classes_version == 2
+
+
+def test_install_never_goes_back_a_version():
+    store = _Store()
+    with store.lock:
+        store.install_classes([{"id": 2}], _versions(classes=5), epoch=0)
+        store.install_classes([{"id": 1}], _versions(classes=4), epoch=0)
+        store.install_filtered("page", ["new"], 5, epoch=0)
+        store.install_filtered("page", ["old"], 4, epoch=0)
+    assert store.classes == [{"id": 2}]
+    assert store.classes_version == 5
+    assert store.filtered == {"page": ["new"]}
+
+
+def test_preload_serves_the_first_view_from_one_snapshot():
+    store = _Store()
+    snapshot = {
+        "creatures": [{"id": 1, "name": "Hydra"}],
+        "classes": [{"id": 1, "name": "Draconic"}],
+        "next_cursor": None,
+        "total": 1,
+        "versions": _versions(3, 2),
+    }
+    stats = {"total": 1}
+    unused = Mock(side_effect=AssertionError("no request after the snapshot"))
+
+    with (
+        patch.object(api_utils, "_store", return_value=store),
+        patch.object(api_client, "get_snapshot", return_value=(snapshot, stats)),
+        patch.object(api_client, "get_versions", unused),
+        patch.object(api_client, "get_classes", unused),
+        patch.object(api_client, "get_creature_page", unused),
+        patch.object(api_client, "get_creature_stats", unused),
+    ):
+        api_utils.preload(25)
+        assert api_utils.get_creature_stats() == stats
+        assert api_utils.get_creature_page({}, None, 25) == (
+            snapshot["creatures"],
+            None,
+            1,
+        )
+        assert api_utils.get_classes() == snapshot["classes"]
+        api_utils.preload(25)  # warm: nothing to do
+        api_client.get_snapshot.assert_called_once_with(25)
+
+
+def test_filtered_results_from_before_a_write_are_not_cached():
+    store = _Store()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        with store.lock:
+            store.advance(CREATURES)
+        return [{"id": len(calls)}]
+
+    with patch.object(api_client, "get_versions", return_value=_versions()):
+        assert api_utils._filtered(store, "key", fetch) == [{"id": 1}]
+        store.checked_at = 0.0
+        assert api_utils._filtered(store, "key", fetch) == [{"id": 2}]
+    assert len(calls) == 2
+
+
+@pytest.fixture(name="searches")
+def searches_fixture():
+    """A fresh store and a pool that records each search without running it."""
+    store = _Store()
+    pool = Mock()
+    pool.submit.side_effect = lambda *args: Mock(name=f"search {args[1:]}")
+    with (
+        patch.object(api_utils, "_store", return_value=store),
+        patch.object(api_utils, "_search_pool", pool),
+        patch.object(api_client, "get_versions", return_value=_versions()),
+    ):
+        yield store, pool
+
+
+def test_search_request_reuses_and_cancels(searches):
+    _, pool = searches
+    request = api_utils.SearchRequest()
+    first = request.submit("hydra")
+    assert request.submit("hydra") is first
+    assert pool.submit.call_count == 1
+
+    second = request.submit("hydra", {"mythology": ["Greek"]})
+    assert second is not first
+    first.cancel.assert_called_once()
+    assert pool.submit.call_args.args[1:] == ("hydra", 50, {"mythology": ["Greek"]})
+
+
+def test_search_request_reruns_after_a_write(searches):
+    store, pool = searches
+    request = api_utils.SearchRequest()
+    first = request.submit("hydra")
+
+    # A write from this process
+    with store.lock:
+        store.advance(CREATURES)
+    second = request.submit("hydra")
+    assert second is not first
+
+    # A write on the backend, seen at the next version poll
+    store.checked_at = 0.0
+    with patch.object(api_client, "get_versions", return_value=_versions(7)):
+        third = request.submit("hydra")
+    assert third is not second
+    assert request.submit("hydra") is third
+    assert pool.submit.call_count == 3
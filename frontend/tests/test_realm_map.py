@@ -0,0 +1,56 @@
+import io
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+Image = pytest.importorskip("PIL.Image")
+pytest.importorskip("streamlit")
+
+import realm_map  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clear_tiles():
+    realm_map.map_tile.clear()
+    yield
+    realm_map.map_tile.clear()
+
+
+def _decode(data: bytes):
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+def test_map_tile_scales_the_overview_to_max_width():
+    source = Image.new("RGB", (1600, 1000), "white")
+    with patch.object(realm_map, "_source", return_value=source):
+        overview = _decode(realm_map.map_tile(1, max_width=400))
+
+    assert overview.format == "JPEG"
+    assert overview.info.get("progressive")
+    assert overview.size == (400, 250)
+
+
+def test_map_tile_cuts_one_tile_of_the_grid():
+    source = Image.new("RGB", (1600, 1000), "white")
+    source.paste((255, 0, 0), (800, 500, 1600, 1000))  # the south-east quarter
+    with patch.object(realm_map, "_source", return_value=source):
+        south_east = _decode(realm_map.map_tile(2, row=1, col=1, max_width=400))
+        north_west = _decode(realm_map.map_tile(2, row=0, col=0, max_width=400))
+
+    assert south_east.size == north_west.size == (400, 250)
+    red, green, _ = south_east.getpixel((200, 125))
+    assert red > 200 and green < 60
+    assert north_west.getpixel((200, 125))[1] > 200  # still white
+
+
+def test_source_decodes_the_shipped_map():
+    realm_map._source.clear()
+    source = realm_map._source()
+    assert source.mode == "RGB"
+    assert source.width > 0 and source.height > 0
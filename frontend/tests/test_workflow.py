@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 import requests
 import sys
 import os
@@ -27,7 +27,10 @@ def test_streamlit_workflow_create_creature_then_visible_in_registry():
         "danger_level": 10,
     }
 
-    with patch("requests.post") as mock_post, patch("requests.get") as mock_get:
+    with (
+        patch.object(api_client.session, "post") as mock_post,
+        patch.object(api_client.session, "get") as mock_get,
+    ):
         # Setup Mocks
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = new_creature
@@ -55,7 +58,7 @@ def test_streamlit_backend_unreachable_shows_friendly_error_and_no_crash():
     Verify that if the backend is down, the app handles it gracefully
     (returns empty list instead of crashing).
     """
-    with patch("requests.get") as mock_get:
+    with patch.object(api_client.session, "get") as mock_get:
         # Simulate connection error
         mock_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
 
@@ -80,7 +83,7 @@ def test_summary_metric_matches_backend_count():
         {"id": 3, "name": "C", "danger_level": 5},
     ]
 
-    with patch("requests.get") as mock_get:
+    with patch.object(api_client.session, "get") as mock_get:
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = mock_data
 
@@ -92,3 +95,150 @@ def test_summary_metric_matches_backend_count():
 
         # Verify
         assert total_count == 3
+
+
+# --- Test 4: Conditional GET (ETag reuse) ---
+def test_not_modified_reuses_cached_body():
+    """
+    Verify that the client sends If-None-Match and reuses its cached
+    classes when the backend answers 304 Not Modified.
+    """
+    classes = [{"id": 1, "name": "Draconic"}]
+    api_client._etag_cache.clear()
+
+    with patch.object(api_client.session, "get") as mock_get:
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {"ETag": '"creatureclass-1-abc"'}
+        mock_get.return_value.json.return_value = classes
+        assert api_client.get_classes() == classes
+
+        mock_get.return_value.status_code = 304
+        mock_get.return_value.json.side_effect = AssertionError("body not expected")
+        assert api_client.get_classes() == classes
+
+        sent_headers = mock_get.call_args.kwargs["headers"]
+        assert sent_headers == {"If-None-Match": '"creatureclass-1-abc"'}
+
+
+def test_etag_cache_keeps_only_recent_urls():
+    api_client._etag_cache.clear()
+
+    with (
+        patch.object(api_client, "ETAG_CACHE_SIZE", 2),
+        patch.object(api_client.session, "get") as mock_get,
+    ):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {"ETag": '"tag"'}
+        mock_get.return_value.json.return_value = []
+        api_client.get_creature_page({"mythology": ["Norse"]})
+        api_client.get_creature_page({"mythology": ["Greek"]})
+        api_client.get_creature_page({"mythology": ["Norse"]})  # now most recent
+        api_client.get_creature_page({"mythology": ["Celtic"]})
+
+    assert len(api_client._etag_cache) == 2
+    assert not any("Greek" in key for key in api_client._etag_cache)
+
+
+# --- Test 5: Shared Session (timeouts and counters) ---
+def test_calls_use_shared_session_with_timeout_and_count_errors():
+    before = api_client.get_stats()
+
+    with patch.object(api_client.session, "get") as mock_get:
+        mock_get.side_effect = requests.exceptions.ReadTimeout("slow backend")
+        assert api_client.get_classes() == []
+
+    assert mock_get.call_args.kwargs["timeout"] == api_client.TIMEOUT
+    after = api_client.get_stats()
+    assert after["requests"] == before["requests"] + 1
+    assert after["errors"] == before["errors"] + 1
+
+
+# --- Test 6: Combined Load (snapshot or concurrent fallback) ---
+def test_snapshot_loads_first_page_classes_and_stats_together():
+    snapshot = {
+        "creatures": [{"id": 1, "name": "A"}],
+        "classes": [{"id": 1, "name": "Draconic"}],
+        "next_cursor": None,
+        "total": 1,
+        "versions": {"creature": 3, "creatureclass": 1},
+    }
+    stats = {"total": 1}
+    urls = []
+
+    def fake_get(url, **kwargs):
+        urls.append(url.removeprefix(api_client.API_URL))
+        response = Mock(headers={}, status_code=200)
+        response.json.return_value = stats if url.endswith("/stats") else snapshot
+        return response
+
+    api_client._etag_cache.clear()
+    with patch.object(api_client.session, "get", side_effect=fake_get):
+        assert api_client.get_snapshot(limit=25) == (snapshot, stats)
+
+    assert sorted(urls) == ["/creatures/stats", "/snapshot"]
+
+
+def test_snapshot_falls_back_to_separate_requests():
+    def fake_get(url, **kwargs):
+        response = Mock(headers={})
+        if url.endswith("/snapshot"):
+            response.status_code = 404
+            return response
+        response.status_code = 200
+        if url.endswith("/version"):
+            response.json.return_value = {"creature": 3, "creatureclass": 1}
+        elif url.endswith("/stats"):
+            response.json.return_value = {"total": 1}
+        else:
+            response.json.return_value = [{"id": 1, "name": url.rsplit("/", 2)[-2]}]
+        return response
+
+    api_client._etag_cache.clear()
+    with patch.object(api_client.session, "get", side_effect=fake_get):
+        snapshot, stats = api_client.get_snapshot()
+
+    assert snapshot == {
+        "creatures": [{"id": 1, "name": "creatures"}],
+        "classes": [{"id": 1, "name": "classes"}],
+        "next_cursor": None,
+        "total": 1,
+        "versions": {"creature": 3, "creatureclass": 1},
+    }
+    assert stats == {"total": 1}
+
+
+# --- Test 7: Type-ahead Search (limited backend call) ---
+def test_search_sends_limited_query_and_survives_errors():
+    hits = [{"id": 1, "name": "Red Dragon"}]
+
+    with patch.object(api_client.session, "get") as mock_get:
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = hits
+        assert api_client.search_creatures("drag", limit=5) == hits
+        assert mock_get.call_args.kwargs["params"] == {"q": "drag", "limit": 5}
+
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+        assert api_client.search_creatures("drag") == []
+
+
+# --- Test 8: Table Paging (cursor and total from headers) ---
+def test_creature_page_reads_cursor_and_total():
+    page = [{"id": 7, "name": "A"}, {"id": 9, "name": "B"}]
+    api_client._etag_cache.clear()
+
+    with patch.object(api_client.session, "get") as mock_get:
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {"X-Next-Cursor": "9", "X-Total-Count": "40"}
+        mock_get.return_value.json.return_value = page
+        rows, cursor, total = api_client.get_creature_page(
+            {"mythology": ["Norse"]}, after_id=3, limit=2
+        )
+
+    assert (rows, cursor, total) == (page, 9, 40)
+    params = mock_get.call_args.kwargs["params"]
+    assert params == {
+        "mythology": ["Norse"],
+        "limit": 2,
+        "after_id": 3,
+        "with_total": True,
+    }